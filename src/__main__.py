@@ -1,7 +1,9 @@
 """Main file of the project 'Non Linear Search'."""
 
 # Import used Python libraries
+import json
 import sys
+from argparse import ArgumentParser, Namespace
 
 # Import PI for function two
 from math import pi
@@ -12,6 +14,10 @@ from classes.function2 import Function2
 from classes.function3 import Function3
 from classes.vector import Vector
 from classes.point import Point
+from classes.parameter_profile import ParameterProfile
+
+# The classes of the other modes are imported in their branches to keep the plain
+# run fast, as they pull in the HTTP, socket and multiprocessing libraries
 
 # Global constants
 # ====================================================================
@@ -27,28 +33,231 @@ INTERVALS: dict[int, list[Point]] = {
 EDGE_SEARCH: bool = False
 
 
-def main() -> int:
+def parse_arguments(arguments: list[str] | None) -> Namespace:
+    """
+    Parse the command line arguments.
+
+    Parameters
+    ----------
+    arguments: list[str] | None
+        The command line arguments, defaults to the arguments of the process.
+
+    Returns
+    -------
+    Namespace
+        The parsed arguments.
+
+    """
+    parser: ArgumentParser = ArgumentParser(description="Non Linear Search")
+    parser.add_argument("--serve", action="store_true",
+                        help="run as a service answering optimization requests")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="host the service listens on")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="port the service or the shard worker listens on")
+    parser.add_argument("--socket", default=None,
+                        help="Unix domain socket the service listens on instead")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes of the service or the tuner")
+    parser.add_argument("--worker", action="store_true",
+                        help="run as a shard worker waiting for a coordinator")
+    parser.add_argument("--coordinate", default=None, metavar="HOST:PORT,...",
+                        help="distribute the shards read from --jobs to workers")
+    parser.add_argument("--jobs", default=None,
+                        help="JSON lines file with one shard per line (default: stdin)")
+    parser.add_argument("--batch", type=int, default=None, metavar="STARTS",
+                        help="run the method from a number of random starting points")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of the random starting points of the batch")
+    parser.add_argument("--patience", type=int, default=None,
+                        help="stop the batch after this many starts without new basin")
+    parser.add_argument("--basin-tolerance", type=float, default=0.1,
+                        help="distance in which found minima belong to the same basin")
+    parser.add_argument("--checkpoint", default="batch.checkpoint",
+                        help="checkpoint file of the batch")
+    parser.add_argument("--resume", action="store_true",
+                        help="resume the batch from its checkpoint file")
+    parser.add_argument("--checkpoint-seconds", type=float, default=60.0,
+                        help="seconds between two checkpoints of the batch")
+    parser.add_argument("--checkpoint-iterations", type=int, default=None,
+                        help="steps between two checkpoints of the batch")
+    parser.add_argument("--tune", action="store_true",
+                        help="tune the parameters of the function and save the profile")
+    parser.add_argument("--tune-starts", type=int, default=10,
+                        help="number of random starting points used for tuning")
+    parser.add_argument("--target-error", type=float, default=0.01,
+                        help="maximal average error of the selected parameters")
+
+    return parser.parse_args(arguments)
+
+
+def run_shards(parsed: Namespace) -> int:
+    """
+    Run as shard worker or distribute shards to workers as coordinator.
+
+    Parameters
+    ----------
+    parsed: Namespace
+        The parsed command line arguments.
+
+    Returns
+    -------
+    int
+        The exitcode of the program.
+
+    """
+    if parsed.worker:
+        # pylint: disable-next=import-outside-toplevel
+        from classes.shard_worker import ShardWorker
+        try:
+            ShardWorker(INTERVALS).serve(parsed.host, parsed.port)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    # pylint: disable-next=import-outside-toplevel
+    from classes.shard_coordinator import ShardCoordinator
+
+    # Read the shards and the addresses of the workers
+    with (open(parsed.jobs, encoding="utf-8") if parsed.jobs else sys.stdin) as file:
+        jobs: list[dict] = [json.loads(line) for line in file if line.strip()]
+    workers: list[tuple[str, int]] = [
+        (address.rsplit(":", 1)[0], int(address.rsplit(":", 1)[1]))
+        for address in parsed.coordinate.split(",")]
+
+    # Print the results as one stream in the order they arrive
+    for job, result in ShardCoordinator(workers).run(jobs):
+        print(json.dumps({"job": job, "result": result}), flush=True)
+
+    return 0
+
+
+def run_batch(parsed: Namespace, function: Function1) -> int:
+    """
+    Run the selected method from many starting points with checkpoints.
+
+    Parameters
+    ----------
+    parsed: Namespace
+        The parsed command line arguments.
+    function: Function1
+        The function whose minima are searched.
+
+    Returns
+    -------
+    int
+        The exitcode of the program.
+
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from classes.batch_runner import BatchRunner
+    # pylint: disable-next=import-outside-toplevel
+    from classes.minima_collection import MinimaCollection
+    runner: BatchRunner = BatchRunner(
+        function, parsed.checkpoint, parsed.checkpoint_seconds,
+        parsed.checkpoint_iterations)
+
+    # Continue the batch of the checkpoint or start a new one
+    state: dict | None = runner.load_state() if parsed.resume else None
+    if parsed.resume and state is None:
+        print(f"There is no checkpoint '{parsed.checkpoint}' to resume",
+              file=sys.stderr)
+        return 1
+    if state is None:
+        method: str = "edge_search" if EDGE_SEARCH else "gradient_descend"
+        state = runner.create_state(
+            method,
+            ParameterProfile.get_parameters(function.get_profile_name(), method),
+            parsed.batch or 1, parsed.seed)
+
+    # Collect the found minima into basins to stop once no new basins are found
+    collection: MinimaCollection = MinimaCollection(
+        function, parsed.basin_tolerance, parsed.patience)
+
+    for found_min in runner.run(state, collection):
+        print("The found minimum is at (", found_min.get_x_value(),
+              ";", found_min.get_y_value(), ")")
+    for basin, hits in zip(collection.get_minima(), collection.get_hit_counts()):
+        print("The basin at (", basin.get_x_value(), ";", basin.get_y_value(),
+              ") was found", hits, "times")
+
+    return 0
+
+
+def run_tuner(parsed: Namespace, function: Function1) -> int:
+    """
+    Tune the parameters of the methods and save them in the profile.
+
+    Parameters
+    ----------
+    parsed: Namespace
+        The parsed command line arguments.
+    function: Function1
+        The function whose parameters are tuned.
+
+    Returns
+    -------
+    int
+        The exitcode of the program.
+
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from classes.parameter_tuner import ParameterTuner
+    tuner: ParameterTuner = ParameterTuner(function, parsed.tune_starts, parsed.seed)
+    entry: dict = tuner.create_profile(parsed.target_error, parsed.workers)
+
+    # Update the profile of the function and keep the ones of other functions
+    profile: dict = ParameterProfile.load()
+    profile[function.get_profile_name()] = entry
+    ParameterProfile.save(profile)
+
+    # Print the Pareto front of every method
+    for method, result in entry.items():
+        print(method, "selected", result["selected"])
+        for setting in result["pareto"]:
+            print(f"  {setting['parameters']}: {setting['evaluations']:.1f} "
+                  f"evaluations, {setting['seconds'] * 1000:.2f} ms, "
+                  f"error {setting['error']:.2e}")
+
+    return 0
+
+
+def main(arguments: list[str] | None = None) -> int:
     """Execute the selected algorithm for the selected method."""
+    parsed: Namespace = parse_arguments(arguments)
+
+    # Run as a service if requested
+    if parsed.serve:
+        # pylint: disable-next=import-outside-toplevel
+        from classes.optimization_service import OptimizationService
+        service: OptimizationService = OptimizationService(INTERVALS, parsed.workers)
+        try:
+            service.serve(parsed.host, parsed.port, parsed.socket)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    # Run as shard worker or coordinator if requested
+    if parsed.worker or parsed.coordinate:
+        return run_shards(parsed)
+
     # Initialize the function
     function: Function1 = Function1(INTERVALS[1])
 
-    # Perform the actions needed for the selected method
-    if EDGE_SEARCH:
-        # Initialize the parameters used by the method
-        distance: float = 0.01
-        number_of_steps: int = 30
+    # Tune the parameters if requested
+    if parsed.tune:
+        return run_tuner(parsed, function)
 
-        # Execute the method
-        found_min: Point = function.edge_search(
-            STARTING_POINT, distance, number_of_steps)
-    else:
-        # Initialize the parameters used by the method
-        distance: float = 0.01
-        factor: float = 0.1
+    # Run a batch of starting points if requested
+    if parsed.batch is not None or parsed.resume:
+        return run_batch(parsed, function)
 
-        # Execute the method
-        found_min: Point = function.gradient_descend(
-            STARTING_POINT, distance, factor)
+    # Perform the actions needed for the selected method, the parameters used by
+    # the methods are taken from the parameter profile
+    if EDGE_SEARCH:
+        found_min: Point = function.edge_search(STARTING_POINT)
+    else:
+        found_min = function.gradient_descend(STARTING_POINT)
 
     # Print the result
     print("The found minimum is at (", found_min.get_x_value(),
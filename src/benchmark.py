@@ -0,0 +1,127 @@
+"""Benchmark reporting the error to the known optimum against the evaluations."""
+
+# Import used Python libraries
+import sys
+from argparse import ArgumentParser, Namespace
+from random import Random
+from typing import Callable
+
+# Import used classes
+from classes.ackley import Ackley
+from classes.beale import Beale
+from classes.benchmark_function import BenchmarkFunction
+from classes.booth import Booth
+from classes.counting_function import CountingFunction
+from classes.himmelblau import Himmelblau
+from classes.ill_conditioned_quadratic import IllConditionedQuadratic
+from classes.point import Point
+from classes.rastrigin import Rastrigin
+from classes.rosenbrock import Rosenbrock
+from classes.simplex_search import SimplexSearch
+from classes.stochastic_search import StochasticSearch
+from classes.surrogate_function import SurrogateFunction
+
+# Global constants
+# ====================================================================
+# Parameters used by the methods
+DISTANCE: float = 0.01
+FACTOR: float = 0.1
+NUMBER_OF_STEPS: int = 30
+# Benchmarked functions
+FUNCTIONS: list[BenchmarkFunction] = [
+    Rosenbrock(), Himmelblau(), Rastrigin(), Ackley(), Beale(), Booth(),
+    IllConditionedQuadratic(condition=10.0), IllConditionedQuadratic(condition=1000.0)]
+# Benchmarked methods, each executed on a counting function from a starting point
+METHODS: dict[str, Callable[[CountingFunction, Point], Point]] = {
+    "gradient_descend": lambda function, point: function.gradient_descend(
+        point, DISTANCE, FACTOR),
+    "projected_gradient_descend": lambda function, point: (
+        function.projected_gradient_descend(point, DISTANCE, FACTOR)),
+    "edge_search": lambda function, point: function.edge_search(
+        point, DISTANCE, NUMBER_OF_STEPS),
+    "nelder_mead_search": lambda function, point: SimplexSearch(
+        function).nelder_mead_search(point, DISTANCE),
+    "surrogate_search": lambda function, point: SurrogateFunction(
+        function).surrogate_search(point, DISTANCE),
+    "basin_hopping": lambda function, point: StochasticSearch(
+        function).basin_hopping(point, DISTANCE, FACTOR, 1.0, 20, seed=0),
+    "simulated_annealing": lambda function, point: StochasticSearch(
+        function).simulated_annealing(point, DISTANCE, 1.0, 1.0, seed=0),
+}
+
+
+def benchmark(function: BenchmarkFunction, method: str,
+              starting_points: list[Point]) -> tuple[float, float, float]:
+    """
+    Execute a method from all starting points and average the results.
+
+    Parameters
+    ----------
+    function: BenchmarkFunction
+        The benchmarked function.
+    method: str
+        Name of the benchmarked method.
+    starting_points: list[Point]
+        Points from which the method starts.
+
+    Returns
+    -------
+    tuple[float, float, float]
+        Average number of evaluations, of gradients and of the error to the closest
+        known optimum.
+
+    """
+    evaluations: int = 0
+    gradients: int = 0
+    error: float = 0.0
+
+    for starting_point in starting_points:
+        counting: CountingFunction = CountingFunction(function)
+        try:
+            found_min: Point = METHODS[method](counting, starting_point)
+            error += function.get_error(found_min)
+        except ZeroDivisionError:
+            # The gradient descend can not normalize a vanishing gradient
+            error += float("inf")
+        evaluations += counting.get_evaluation_count()
+        gradients += counting.get_gradient_count()
+
+    return (evaluations / len(starting_points), gradients / len(starting_points),
+            error / len(starting_points))
+
+
+def main() -> int:
+    """Print the evaluations and the error of every method for every function."""
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--starts", type=int, default=5,
+                        help="number of random starting points per function")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the random starting points")
+    parser.add_argument("--methods", default=",".join(METHODS),
+                        help="comma separated names of the benchmarked methods")
+    parsed: Namespace = parser.parse_args()
+
+    random: Random = Random(parsed.seed)
+    print(f"{'function':<31}{'method':<28}{'evaluations':>12}{'gradients':>11}"
+          f"{'error':>12}")
+
+    for function in FUNCTIONS:
+        lower, upper = function.get_intervals()
+        starting_points: list[Point] = [
+            Point(random.uniform(lower.get_x_value(), upper.get_x_value()),
+                  random.uniform(lower.get_y_value(), upper.get_y_value()))
+            for _ in range(parsed.starts)]
+        name: str = type(function).__name__
+        if isinstance(function, IllConditionedQuadratic):
+            name += f"({function.get_condition():g})"
+
+        for method in parsed.methods.split(","):
+            evaluations, gradients, error = benchmark(function, method, starting_points)
+            print(f"{name:<31}{method:<28}{evaluations:>12.1f}{gradients:>11.1f}"
+                  f"{error:>12.2e}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
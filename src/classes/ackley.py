@@ -0,0 +1,98 @@
+"""File containing the class for the Ackley benchmark function."""
+
+# Import used mathematical functions
+from math import cos, e, exp, pi, sin, sqrt
+
+# Import used classes
+from classes.benchmark_function import BenchmarkFunction
+from classes.vector import Vector
+from classes.point import Point
+
+class Ackley(BenchmarkFunction):
+    """
+    Ackley benchmark function.
+
+    The function is defined as follows:
+    -20 * exp(-0.2 * sqrt(0.5 * (x^2 + y^2)))
+    - exp(0.5 * (cos(2 * pi * x) + cos(2 * pi * y))) + e + 20
+
+    Methods
+    -------
+    get_value
+        Calculate the value of a two dimensional function at a point.
+    get_values
+        Calculate the values of the function at multiple points.
+    get_gradient
+        Get the value of the gradient at a specified point.
+
+    """
+
+    INTERVALS: list[Point] = [Point(-5.0, -5.0), Point(5.0, 5.0)]
+    KNOWN_MINIMA: list[Point] = [Point(0.0, 0.0)]
+
+    def get_value(self, x_value: float, y_value: float) -> float:
+        """
+        Calculate the value of a two dimensional function at a point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        float
+            Value of the function at the specified point.
+
+        """
+        return (-20 * exp(-0.2 * sqrt(0.5 * (x_value ** 2 + y_value ** 2))) -
+                exp(0.5 * (cos(2 * pi * x_value) + cos(2 * pi * y_value))) + e + 20)
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the function at multiple points.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the function at the specified points.
+
+        """
+        return [-20 * exp(-0.2 * sqrt(0.5 * (x * x + y * y))) -
+                exp(0.5 * (cos(2 * pi * x) + cos(2 * pi * y))) + e + 20
+                for x, y in zip(x_values, y_values)]
+
+    def get_gradient(self, x_value: float, y_value: float) -> Vector:
+        """
+        Get the value of the gradient at a specified point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        Vector
+            Values of the gradient at the specified point.
+
+        """
+        radius: float = sqrt(0.5 * (x_value ** 2 + y_value ** 2))
+        cosine: float = exp(0.5 * (cos(2 * pi * x_value) + cos(2 * pi * y_value)))
+
+        # The first term is not differentiable at the origin, use its limit there
+        first: float = 2 * exp(-0.2 * radius) / radius if radius > 0 else 0.0
+
+        return Vector(first * x_value + pi * sin(2 * pi * x_value) * cosine,
+                      first * y_value + pi * sin(2 * pi * y_value) * cosine)
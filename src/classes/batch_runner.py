@@ -0,0 +1,331 @@
+"""File containing the class BatchRunner."""
+
+# Import used Python libraries
+import gzip
+import json
+import os
+import time
+from random import Random
+
+# Import used classes
+from classes.function import Function
+from classes.minima_collection import MinimaCollection
+from classes.point import Point
+
+class BatchRunner:
+    """
+    Class running a batch of edge searches or gradient descends with checkpoints.
+
+    Every starting point is a lane whose state consists of its current point and,
+    for the gradient descend, its current factor and step counter. The lanes are
+    run one after another and advanced one step at a time. The starting point of a
+    lane is drawn once the previous lane is finished, so the state of the random
+    number generator is part of the state of the batch. The whole state is
+    periodically written to a gzip compressed JSON checkpoint. The checkpoint is
+    first written to a temporary file and then moved over the old one, so it is
+    replaced atomically. A batch started again with resume enabled continues from
+    the checkpoint without redoing finished lanes. Given a MinimaCollection, the
+    batch stops early once the collection is saturated.
+
+    Attributes
+    ----------
+    function: Function
+        The function whose minima are searched.
+    path: str
+        Path of the checkpoint file.
+    seconds: float | None
+        Seconds after which a checkpoint is written.
+    iterations: int | None
+        Number of steps after which a checkpoint is written.
+
+    Methods
+    -------
+    get_function
+        Return the function whose minima are searched.
+    get_path
+        Return the path of the checkpoint file.
+    create_state
+        Create the state of a new batch with random starting points.
+    load_state
+        Load the state of a batch from the checkpoint file.
+    save_state
+        Write the state of a batch atomically to the checkpoint file.
+    run
+        Run a batch until all lanes are finished and return their results.
+
+    """
+
+    # Methods that can be run as batch
+    METHODS: tuple[str, ...] = ("edge_search", "gradient_descend")
+
+    def __init__(self, function: Function, path: str, seconds: float | None = 60.0,
+                 iterations: int | None = None) -> None:
+        """
+        Construct one runner with the given parameters.
+
+        Parameters
+        ----------
+        function: Function
+            The function whose minima are searched.
+        path: str
+            Path of the checkpoint file.
+        seconds: float | None
+            Seconds after which a checkpoint is written. None disables the timer.
+        iterations: int | None
+            Number of steps after which a checkpoint is written. None disables the
+            counter.
+
+        """
+        self.__function: Function = function
+        self.__path: str = path
+        self.__seconds: float | None = seconds
+        self.__iterations: int | None = iterations
+
+    def get_function(self) -> Function:
+        """
+        Return the function whose minima are searched.
+
+        Returns
+        -------
+        function: Function
+            The function whose minima are searched.
+
+        """
+        return self.__function
+
+    def get_path(self) -> str:
+        """
+        Return the path of the checkpoint file.
+
+        Returns
+        -------
+        path: str
+            Path of the checkpoint file.
+
+        """
+        return self.__path
+
+    def create_state(self, method: str, parameters: dict, number_of_starts: int,
+                     seed: int | None = None) -> dict:
+        """
+        Create the state of a new batch with random starting points.
+
+        The starting points are drawn while the batch is run.
+
+        Parameters
+        ----------
+        method: str
+            Either 'edge_search' or 'gradient_descend'.
+        parameters: dict
+            The parameters 'distance' and either 'number_of_steps' or 'factor'.
+        number_of_starts: int
+            Number of random starting points within the intervals of the function.
+        seed: int | None
+            Seed of the random number generator.
+
+        Returns
+        -------
+        dict
+            The state of the batch.
+
+        """
+        if method not in BatchRunner.METHODS:
+            raise ValueError(f"Unknown method '{method}'")
+
+        return {"method": method, "parameters": parameters,
+                "starts": number_of_starts,
+                "random": BatchRunner.__encode_random(Random(seed).getstate()),
+                "lanes": []}
+
+    def load_state(self) -> dict | None:
+        """
+        Load the state of a batch from the checkpoint file.
+
+        Returns
+        -------
+        dict | None
+            The state of the batch or None if there is no checkpoint.
+
+        """
+        if not os.path.exists(self.get_path()):
+            return None
+
+        with gzip.open(self.get_path(), "rt", encoding="utf-8") as checkpoint:
+            return json.load(checkpoint)
+
+    def save_state(self, state: dict) -> None:
+        """
+        Write the state of a batch atomically to the checkpoint file.
+
+        Parameters
+        ----------
+        state: dict
+            The state of the batch.
+
+        """
+        temporary: str = self.get_path() + ".tmp"
+
+        with gzip.open(temporary, "wt", encoding="utf-8") as checkpoint:
+            json.dump(state, checkpoint, separators=(",", ":"))
+        with open(temporary, "rb") as checkpoint:
+            os.fsync(checkpoint.fileno())
+        os.replace(temporary, self.get_path())
+
+    def run(self, state: dict,
+            collection: MinimaCollection | None = None) -> list[Point]:
+        """
+        Run a batch until all lanes are finished and return their results.
+
+        Parameters
+        ----------
+        state: dict
+            The state of a new batch or one loaded from the checkpoint file.
+        collection: MinimaCollection | None
+            Collection receiving the result of every finished lane. No further
+            lanes are started once it is saturated.
+
+        Returns
+        -------
+        list[Point]
+            The determined minima in the order of the lanes.
+
+        """
+        last_save: float = time.monotonic()
+        steps: int = 0
+        random: Random = BatchRunner.__restore_random(state)
+
+        # Collect the results of the lanes finished before an interruption
+        if collection is not None:
+            for finished in state["lanes"]:
+                if finished["result"] is not None:
+                    collection.add(Point(*finished["result"]))
+
+        while True:
+            # Draw the starting point of the next lane once the last one is finished
+            if not state["lanes"] or state["lanes"][-1]["result"] is not None:
+                if len(state["lanes"]) >= state["starts"] or (
+                        collection is not None and collection.is_saturated()):
+                    break
+                state["lanes"].append(self.__create_lane(random, state["parameters"]))
+                state["random"] = BatchRunner.__encode_random(random.getstate())
+
+            lane: dict = state["lanes"][-1]
+            while lane["result"] is None:
+                self.__step(state["method"], state["parameters"], lane)
+                steps += 1
+
+                # Write a checkpoint once the time or the number of steps is reached
+                if ((self.__seconds is not None and
+                     time.monotonic() - last_save >= self.__seconds) or
+                        (self.__iterations is not None and
+                         steps >= self.__iterations)):
+                    self.save_state(state)
+                    last_save, steps = time.monotonic(), 0
+
+            if collection is not None:
+                collection.add(Point(*lane["result"]))
+
+        self.save_state(state)
+
+        return [Point(*lane["result"]) for lane in state["lanes"]]
+
+    def __create_lane(self, random: Random, parameters: dict) -> dict:
+        """
+        Create a lane starting at a random point within the intervals.
+
+        Parameters
+        ----------
+        random: Random
+            Random number generator of the batch.
+        parameters: dict
+            The parameters of the method.
+
+        Returns
+        -------
+        dict
+            The state of the new lane.
+
+        """
+        lower, upper = self.get_function().get_intervals()
+        start: list[float] = [
+            random.uniform(lower.get_x_value(), upper.get_x_value()),
+            random.uniform(lower.get_y_value(), upper.get_y_value())]
+
+        return {"start": start, "point": start, "factor": parameters.get("factor"),
+                "count": 0, "result": None}
+
+    def __step(self, method: str, parameters: dict, lane: dict) -> None:
+        """
+        Advance one lane by one step of its method.
+
+        Parameters
+        ----------
+        method: str
+            Either 'edge_search' or 'gradient_descend'.
+        parameters: dict
+            The parameters of the method.
+        lane: dict
+            The state of the lane, updated in place.
+
+        """
+        last_point: Point = Point(*lane["point"])
+
+        if method == "edge_search":
+            determined_point: Point = self.get_function().edge_search_step(
+                last_point, int(parameters["number_of_steps"]))
+        else:
+            # Reduce the factor each time the threshold is passed
+            if (lane["count"] % Function.get_decay_threshold(parameters["distance"]) ==
+                    0 and lane["count"] != 0):
+                lane["factor"] /= 10
+            determined_point = self.get_function().gradient_descend_step(
+                last_point, lane["factor"])
+            lane["count"] += 1
+
+        point: list[float] = [determined_point.get_x_value(),
+                              determined_point.get_y_value()]
+        if Point.points_are_in_range(last_point, determined_point,
+                                     parameters["distance"]):
+            lane["result"] = point
+        lane["point"] = point
+
+    @staticmethod
+    def __restore_random(state: dict) -> Random:
+        """
+        Rebuild the random number generator stored in the state of a batch.
+
+        Parameters
+        ----------
+        state: dict
+            The state of the batch.
+
+        Returns
+        -------
+        random: Random
+            Random number generator continuing where the batch left off.
+
+        """
+        random: Random = Random()
+        random.setstate(tuple(
+            tuple(item) if isinstance(item, list) else item
+            for item in state["random"]))
+
+        return random
+
+    @staticmethod
+    def __encode_random(state: tuple) -> list:
+        """
+        Convert the state of a random number generator into JSON compatible lists.
+
+        Parameters
+        ----------
+        state: tuple
+            The state as returned by Random.getstate.
+
+        Returns
+        -------
+        list
+            The state with all tuples converted into lists.
+
+        """
+        return [list(item) if isinstance(item, tuple) else item for item in state]
@@ -0,0 +1,97 @@
+"""File containing the class for the Beale benchmark function."""
+
+
+# Import used classes
+from classes.benchmark_function import BenchmarkFunction
+from classes.vector import Vector
+from classes.point import Point
+
+class Beale(BenchmarkFunction):
+    """
+    Beale benchmark function.
+
+    The function is defined as follows:
+    (1.5 - x + x * y)^2 + (2.25 - x + x * y^2)^2 + (2.625 - x + x * y^3)^2
+
+    Methods
+    -------
+    get_value
+        Calculate the value of a two dimensional function at a point.
+    get_values
+        Calculate the values of the function at multiple points.
+    get_gradient
+        Get the value of the gradient at a specified point.
+
+    """
+
+    INTERVALS: list[Point] = [Point(-4.5, -4.5), Point(4.5, 4.5)]
+    KNOWN_MINIMA: list[Point] = [Point(3.0, 0.5)]
+
+    def get_value(self, x_value: float, y_value: float) -> float:
+        """
+        Calculate the value of a two dimensional function at a point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        float
+            Value of the function at the specified point.
+
+        """
+        return ((1.5 - x_value + x_value * y_value) ** 2 +
+                (2.25 - x_value + x_value * y_value ** 2) ** 2 +
+                (2.625 - x_value + x_value * y_value ** 3) ** 2)
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the function at multiple points.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the function at the specified points.
+
+        """
+        return [(1.5 - x + x * y) ** 2 + (2.25 - x + x * y * y) ** 2 +
+                (2.625 - x + x * y * y * y) ** 2
+                for x, y in zip(x_values, y_values)]
+
+    def get_gradient(self, x_value: float, y_value: float) -> Vector:
+        """
+        Get the value of the gradient at a specified point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        Vector
+            Values of the gradient at the specified point.
+
+        """
+        first: float = 1.5 - x_value + x_value * y_value
+        second: float = 2.25 - x_value + x_value * y_value ** 2
+        third: float = 2.625 - x_value + x_value * y_value ** 3
+
+        return Vector(
+            2 * first * (y_value - 1) + 2 * second * (y_value ** 2 - 1) +
+            2 * third * (y_value ** 3 - 1),
+            2 * first * x_value + 4 * second * x_value * y_value +
+            6 * third * x_value * y_value ** 2)
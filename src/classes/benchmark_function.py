@@ -0,0 +1,120 @@
+"""File containing the abstract class BenchmarkFunction."""
+
+# Import used classes
+from classes.function import Function
+from classes.point import Point
+
+class BenchmarkFunction(Function):
+    """
+    Abstract class representing a standard benchmark function with known minima.
+
+    Subclasses define the recommended intervals and the known global minima as
+    class constants, implement get_value and get_gradient and override get_values
+    with a batch implementation.
+
+    Attributes
+    ----------
+    intervals: list[Point]
+        The two corner points of the interval of the function.
+
+    Methods
+    -------
+    set_intervals
+        Set the intervals of the function.
+    get_intervals
+        Return the intervals of the function.
+    get_known_minima
+        Return the known global minima of the function.
+    get_minimum_value
+        Return the value of the function at its global minima.
+    get_error
+        Get the distance of a point to the closest known global minimum.
+
+    """
+
+    # Recommended intervals of the function
+    INTERVALS: list[Point] = []
+    # Known global minima of the function
+    KNOWN_MINIMA: list[Point] = []
+
+    def __init__(self, intervals: list[Point] | None = None) -> None:
+        """
+        Construct one object of the function with the given parameters.
+
+        Parameters
+        ----------
+        intervals: list[Point] | None
+            The two corner points of the interval of the function. Defaults to the
+            recommended intervals.
+
+        """
+        super().__init__()
+        self.set_intervals(intervals if intervals is not None else self.INTERVALS)
+
+    def set_intervals(self, intervals: list[Point]) -> None:
+        """
+        Set the intervals of the function.
+
+        Parameters
+        ----------
+        intervals: list[Point]
+            The two corner points of the interval of the function.
+
+        """
+        self.__intervals: list[Point] = intervals
+
+    def get_intervals(self) -> list[Point]:
+        """
+        Return the intervals of the function.
+
+        Returns
+        -------
+        intervals: list[Point]
+            The two corner points of the interval of the function.
+
+        """
+        return self.__intervals
+
+    def get_known_minima(self) -> list[Point]:
+        """
+        Return the known global minima of the function.
+
+        Returns
+        -------
+        list[Point]
+            The known global minima of the function.
+
+        """
+        return self.KNOWN_MINIMA
+
+    def get_minimum_value(self) -> float:
+        """
+        Return the value of the function at its global minima.
+
+        Returns
+        -------
+        float
+            The value of the function at its global minima.
+
+        """
+        minimum: Point = self.get_known_minima()[0]
+        return self.get_value(minimum.get_x_value(), minimum.get_y_value())
+
+    def get_error(self, point: Point) -> float:
+        """
+        Get the distance of a point to the closest known global minimum.
+
+        Parameters
+        ----------
+        point: Point
+            The point, usually a minimum determined by one of the methods.
+
+        Returns
+        -------
+        float
+            The distance to the closest known global minimum.
+
+        """
+        return min(((point.get_x_value() - minimum.get_x_value()) ** 2 +
+                    (point.get_y_value() - minimum.get_y_value()) ** 2) ** .5
+                   for minimum in self.get_known_minima())
@@ -0,0 +1,88 @@
+"""File containing the class for the Booth benchmark function."""
+
+
+# Import used classes
+from classes.benchmark_function import BenchmarkFunction
+from classes.vector import Vector
+from classes.point import Point
+
+class Booth(BenchmarkFunction):
+    """
+    Booth benchmark function.
+
+    The function is defined as follows:
+    (x + 2 * y - 7)^2 + (2 * x + y - 5)^2
+
+    Methods
+    -------
+    get_value
+        Calculate the value of a two dimensional function at a point.
+    get_values
+        Calculate the values of the function at multiple points.
+    get_gradient
+        Get the value of the gradient at a specified point.
+
+    """
+
+    INTERVALS: list[Point] = [Point(-10.0, -10.0), Point(10.0, 10.0)]
+    KNOWN_MINIMA: list[Point] = [Point(1.0, 3.0)]
+
+    def get_value(self, x_value: float, y_value: float) -> float:
+        """
+        Calculate the value of a two dimensional function at a point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        float
+            Value of the function at the specified point.
+
+        """
+        return (x_value + 2 * y_value - 7) ** 2 + (2 * x_value + y_value - 5) ** 2
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the function at multiple points.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the function at the specified points.
+
+        """
+        return [(x + 2 * y - 7) ** 2 + (2 * x + y - 5) ** 2
+                for x, y in zip(x_values, y_values)]
+
+    def get_gradient(self, x_value: float, y_value: float) -> Vector:
+        """
+        Get the value of the gradient at a specified point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        Vector
+            Values of the gradient at the specified point.
+
+        """
+        return Vector(
+            2 * (x_value + 2 * y_value - 7) + 4 * (2 * x_value + y_value - 5),
+            4 * (x_value + 2 * y_value - 7) + 2 * (2 * x_value + y_value - 5))
@@ -0,0 +1,196 @@
+"""File containing the class CountingFunction."""
+
+
+# Import used classes
+from classes.function import Function
+from classes.vector import Vector
+from classes.point import Point
+
+class CountingFunction(Function):
+    """
+    Function that wraps another function and counts the calls made to it.
+
+    Attributes
+    ----------
+    function: Function
+        The wrapped function.
+    evaluation_count: int
+        Number of values calculated by the wrapped function.
+    gradient_count: int
+        Number of gradients calculated by the wrapped function.
+
+    Methods
+    -------
+    set_function
+        Set the wrapped function.
+    get_function
+        Return the wrapped function.
+    get_intervals
+        Return the intervals of the wrapped function.
+    get_profile_name
+        Return the name of the wrapped function in the parameter profile.
+    get_evaluation_count
+        Return the number of values calculated by the wrapped function.
+    get_gradient_count
+        Return the number of gradients calculated by the wrapped function.
+    reset_counts
+        Reset both counters to zero.
+    get_value
+        Calculate the value of the wrapped function at a point.
+    get_values
+        Calculate the values of the wrapped function at multiple points.
+    get_gradient
+        Get the value of the gradient of the wrapped function at a specified point.
+
+    """
+
+    def __init__(self, function: Function) -> None:
+        """
+        Construct one counting function wrapping the given function.
+
+        Parameters
+        ----------
+        function: Function
+            The wrapped function.
+
+        """
+        super().__init__()
+        self.set_function(function)
+        self.reset_counts()
+
+    def set_function(self, function: Function) -> None:
+        """
+        Set the wrapped function.
+
+        Parameters
+        ----------
+        function: Function
+            The wrapped function.
+
+        """
+        self.__function: Function = function
+
+    def get_function(self) -> Function:
+        """
+        Return the wrapped function.
+
+        Returns
+        -------
+        function: Function
+            The wrapped function.
+
+        """
+        return self.__function
+
+    def get_intervals(self) -> list[Point]:
+        """
+        Return the intervals of the wrapped function.
+
+        Returns
+        -------
+        list[Point]
+            The two corner points of the interval of the wrapped function.
+
+        """
+        return self.get_function().get_intervals()
+
+    def get_profile_name(self) -> str:
+        """
+        Return the name of the wrapped function in the parameter profile.
+
+        Returns
+        -------
+        str
+            The name under which the wrapped function is stored in the profile.
+
+        """
+        return self.get_function().get_profile_name()
+
+    def get_evaluation_count(self) -> int:
+        """
+        Return the number of values calculated by the wrapped function.
+
+        Returns
+        -------
+        evaluation_count: int
+            Number of values calculated by the wrapped function.
+
+        """
+        return self.__evaluation_count
+
+    def get_gradient_count(self) -> int:
+        """
+        Return the number of gradients calculated by the wrapped function.
+
+        Returns
+        -------
+        gradient_count: int
+            Number of gradients calculated by the wrapped function.
+
+        """
+        return self.__gradient_count
+
+    def reset_counts(self) -> None:
+        """Reset both counters to zero."""
+        self.__evaluation_count: int = 0
+        self.__gradient_count: int = 0
+
+    def get_value(self, x_value: float, y_value: float) -> float:
+        """
+        Calculate the value of the wrapped function at a point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        float
+            Value of the wrapped function at the specified point.
+
+        """
+        self.__evaluation_count += 1
+        return self.get_function().get_value(x_value, y_value)
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the wrapped function at multiple points.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the wrapped function at the specified points.
+
+        """
+        self.__evaluation_count += len(x_values)
+        return self.get_function().get_values(x_values, y_values)
+
+    def get_gradient(self, x_value: float, y_value: float) -> Vector:
+        """
+        Get the value of the gradient of the wrapped function at a specified point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        Vector
+            Values of the gradient at the specified point.
+
+        """
+        self.__gradient_count += 1
+        return self.get_function().get_gradient(x_value, y_value)
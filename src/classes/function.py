@@ -4,6 +4,7 @@
 from abc import ABC, abstractmethod
 
 # Import used classes
+from classes.parameter_profile import ParameterProfile
 from classes.point import Point
 from classes.vector import Vector
 
@@ -17,10 +18,38 @@ class Function(ABC):
         Calculate the value of a two dimensional function at a point.
     get_gradient
         Get the value of the gradient at a specified point.
+    get_values
+        Calculate the values of the function at multiple points.
     get_fibonacci_number
         Get the Nth Fibonacci number.
+    get_profile_name
+        Return the name under which the function is stored in the parameter profile.
     gradient_descend
         Use the gradient descend method to determine a minimum.
+    get_decay_threshold
+        Get the number of gradient descend steps after which the factor is reduced.
+    gradient_descend_step
+        Perform one step of the gradient descend method.
+    get_projected_gradient
+        Get the gradient at a point with the components of active bounds removed.
+    projected_gradient_descend
+        Use the projected gradient descend method to determine a minimum in the box.
+    batched_projected_gradient_descend
+        Use the projected gradient descend method from multiple starting points.
+    fibonacci_search
+        Use the Fibonacci Search to find a minimum.
+    get_line_point
+        Get one of the evenly spaced points on a line through the intervals.
+    edge_search
+        Use the edge search method to determine a minimum.
+    edge_search_step
+        Perform one sweep of the edge search method.
+    batched_edge_search
+        Use the edge search method from multiple starting points at once.
+    evaluate_points
+        Calculate the values of the function at multiple points.
+    clamp_point
+        Move a point onto the closest point within the intervals of the function.
 
     """
 
@@ -61,6 +90,31 @@ class Function(ABC):
             Values of the gradient at the specified point.
 
         """
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the function at multiple points.
+
+        This is the batch evaluation path of the function. By default it calls
+        get_value for every point, subclasses may override it with a faster
+        implementation.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the function at the specified points.
+
+        """
+        return [self.get_value(x_value, y_value)
+                for x_value, y_value in zip(x_values, y_values)]
+
     @staticmethod
     def get_fibonacci_number(number: int) -> int:
         """
@@ -92,8 +146,21 @@ class Function(ABC):
 
         return fibonacci_numbers.pop()
 
+    def get_profile_name(self) -> str:
+        """
+        Return the name under which the function is stored in the parameter profile.
+
+        Returns
+        -------
+        str
+            The name of the class of the function.
+
+        """
+        return type(self).__name__
+
     def gradient_descend(
-            self, starting_point: Point, distance: float, factor: float) -> Point:
+            self, starting_point: Point, distance: float | None = None,
+            factor: float | None = None) -> Point:
         """
         Use the gradient descend method to determine a minimum.
 
@@ -101,11 +168,12 @@ class Function(ABC):
         ----------
         starting_point: Point
             Point from which the method starts.
-        distance: float
+        distance: float | None
             Distance in which two consecutive determined points need to be for the
-            method to stop.
-        factor: float
-            Factor by which the point shall be moved by the vector.
+            method to stop. Defaults to the value of the parameter profile.
+        factor: float | None
+            Factor by which the point shall be moved by the vector. Defaults to the
+            value of the parameter profile.
 
         Returns
         -------
@@ -113,14 +181,18 @@ class Function(ABC):
             Determined point of the minimum.
 
         """
+        # Use the parameters of the profile for all missing parameters
+        if distance is None or factor is None:
+            parameters: dict[str, float] = ParameterProfile.get_parameters(
+                self.get_profile_name(), "gradient_descend")
+            distance = parameters["distance"] if distance is None else distance
+            factor = parameters["factor"] if factor is None else factor
+
         # Initialize the last determined point as the starting point
         last_point: Point = starting_point
 
         # Threshold to reduce the factor
-        threshold: int = int(1 / distance)
-
-        # Ensure that the threshold is at least 10
-        threshold = threshold if threshold > 10 else 10
+        threshold: int = Function.get_decay_threshold(distance)
 
         # Counter checking if the threshold is passed
         count: int = 0
@@ -131,18 +203,8 @@ class Function(ABC):
             if count % threshold == 0 and count != 0:
                 factor /= 10
 
-            # Determine the gradient at the current position
-            gradient: Vector = self.get_gradient(
-                last_point.get_x_value(), last_point.get_y_value())
-
-            # Normalize the gradient
-            gradient.normalize()
-
-            # Negate the values of the gradient
-            gradient.negate_values()
-
-            # Apply the gradient to the point
-            determined_point: Point = last_point.apply_vector(gradient, factor)
+            # Move the point against the gradient
+            determined_point: Point = self.gradient_descend_step(last_point, factor)
 
             # Break the loop if two points are in range to one another
             if Point.points_are_in_range(last_point, determined_point, distance):
@@ -156,6 +218,223 @@ class Function(ABC):
 
         return determined_point
 
+    @staticmethod
+    def get_decay_threshold(distance: float) -> int:
+        """
+        Get the number of gradient descend steps after which the factor is reduced.
+
+        Parameters
+        ----------
+        distance: float
+            Distance in which two consecutive determined points need to be for the
+            method to stop.
+
+        Returns
+        -------
+        threshold: int
+            Number of steps after which the factor is divided by 10, at least 10.
+
+        """
+        threshold: int = int(1 / distance)
+
+        # Ensure that the threshold is at least 10
+        return threshold if threshold > 10 else 10
+
+    def gradient_descend_step(self, last_point: Point, factor: float) -> Point:
+        """
+        Perform one step of the gradient descend method.
+
+        Parameters
+        ----------
+        last_point: Point
+            Point from which the step starts.
+        factor: float
+            Factor by which the point shall be moved by the vector.
+
+        Returns
+        -------
+        Point
+            Point after moving against the normalized gradient.
+
+        """
+        # Determine the gradient at the current position
+        gradient: Vector = self.get_gradient(
+            last_point.get_x_value(), last_point.get_y_value())
+
+        # Normalize the gradient
+        gradient.normalize()
+
+        # Negate the values of the gradient
+        gradient.negate_values()
+
+        # Apply the gradient to the point
+        return last_point.apply_vector(gradient, factor)
+
+    def get_projected_gradient(self, point: Point) -> Vector:
+        """
+        Get the gradient at a point with the components of active bounds removed.
+
+        A bound is active if the point lies on it and moving against the gradient
+        would leave the intervals of the function.
+
+        Parameters
+        ----------
+        point: Point
+            Point within the intervals of the function.
+
+        Returns
+        -------
+        gradient: Vector
+            The gradient whose components of active bounds are zero.
+
+        """
+        lower, upper = self.get_intervals()
+        gradient: Vector = self.get_gradient(point.get_x_value(), point.get_y_value())
+
+        # Remove the X component if the X bound is active
+        if ((point.get_x_value() <= min(lower.get_x_value(), upper.get_x_value()) and
+             gradient.get_x_value() > 0) or
+                (point.get_x_value() >= max(lower.get_x_value(), upper.get_x_value())
+                 and gradient.get_x_value() < 0)):
+            gradient.set_x_value(0.0)
+
+        # Remove the Y component if the Y bound is active
+        if ((point.get_y_value() <= min(lower.get_y_value(), upper.get_y_value()) and
+             gradient.get_y_value() > 0) or
+                (point.get_y_value() >= max(lower.get_y_value(), upper.get_y_value())
+                 and gradient.get_y_value() < 0)):
+            gradient.set_y_value(0.0)
+
+        return gradient
+
+    def __projected_gradient_step(self, point: Point, factor: float) -> Point | None:
+        """
+        Move a point against its normalized projected gradient within the box.
+
+        Parameters
+        ----------
+        point: Point
+            Point within the intervals of the function.
+        factor: float
+            Factor by which the point shall be moved by the vector.
+
+        Returns
+        -------
+        Point | None
+            The moved point clamped to the intervals, None if the projected
+            gradient vanishes.
+
+        """
+        gradient: Vector = self.get_projected_gradient(point)
+        if gradient.get_x_value() == 0 and gradient.get_y_value() == 0:
+            return None
+        gradient.normalize()
+        gradient.negate_values()
+        return self.clamp_point(point.apply_vector(gradient, factor))
+
+    def projected_gradient_descend(
+            self, starting_point: Point, distance: float, factor: float) -> Point:
+        """
+        Use the projected gradient descend method to determine a minimum in the box.
+
+        Every step moves against the normalized projected gradient and is clamped to
+        the intervals of the function. The method stops once the projected gradient
+        vanishes, which is the case in a minimum on the border, or once two
+        consecutive determined points are in range of one another. Steps that do not
+        lower the value are rejected and halve the factor, additionally the factor
+        is reduced like in the gradient descend method.
+
+        Parameters
+        ----------
+        starting_point: Point
+            Point from which the method starts. It is clamped to the intervals.
+        distance: float
+            Distance in which two consecutive determined points need to be for the
+            method to stop.
+        factor: float
+            Factor by which the point shall be moved by the vector.
+
+        Returns
+        -------
+        last_point: Point
+            Determined point of the minimum.
+
+        """
+        return self.batched_projected_gradient_descend(
+            [starting_point], distance, factor)[0][0]
+
+    def batched_projected_gradient_descend(
+            self, starting_points: list[Point], distance: float,
+            factor: float) -> tuple[list[Point], list[float]]:
+        """
+        Use the projected gradient descend method from multiple starting points.
+
+        Every starting point is a lane of its own. The lanes advance in lockstep and
+        the points they step to are evaluated together with one call of get_values
+        per step. A lane is retired once it would stop the projected gradient
+        descend method.
+
+        Parameters
+        ----------
+        starting_points: list[Point]
+            Points from which the method starts. They are clamped to the intervals.
+        distance: float
+            Distance in which two consecutive determined points need to be for a lane
+            to stop.
+        factor: float
+            Factor by which the points shall be moved by the vector.
+
+        Returns
+        -------
+        tuple[list[Point], list[float]]
+            Determined points of the minima and their values in the order of the
+            starting points.
+
+        """
+        points: list[Point] = [self.clamp_point(point) for point in starting_points]
+        values: list[float] = self.evaluate_points(points, True)
+        factors: list[float] = [factor] * len(points)
+        threshold: int = Function.get_decay_threshold(distance)
+        count: int = 0
+
+        # A step shorter than the distance can not leave the range of the last point
+        active: list[int] = list(range(len(points))) if factor > distance else []
+        while active:
+            # Check if the threshold has been passed
+            count += 1
+            if count % threshold == 0:
+                for lane in active:
+                    factors[lane] /= 10
+
+            # Move every lane against its projected gradient, lanes without a
+            # direction of descend are retired
+            candidates: dict[int, Point] = {}
+            for lane in active:
+                candidate: Point | None = self.__projected_gradient_step(
+                    points[lane], factors[lane])
+                if candidate is not None:
+                    candidates[lane] = candidate
+            candidate_values: list[float] = self.evaluate_points(
+                list(candidates.values()), True)
+
+            active = []
+            for lane, value in zip(candidates, candidate_values):
+                # Reject the step if it does not lower the value
+                if value >= values[lane]:
+                    factors[lane] /= 2
+
+                # Retire the lane if two points are in range to one another
+                elif Point.points_are_in_range(
+                        points[lane], candidates[lane], distance):
+                    points[lane], values[lane] = candidates[lane], value
+                    continue
+                else:
+                    points[lane], values[lane] = candidates[lane], value
+                if factors[lane] > distance:
+                    active.append(lane)
+
+        return points, values
+
     def fibonacci_search(self, number_of_steps: int, x_constant: bool,
                          current_point: Point) -> Point:
         """
@@ -186,25 +465,6 @@ class Function(ABC):
         # Calculate the starting point (Fib[n])
         point_left: int = Function.get_fibonacci_number(number_of_steps)
 
-        # Initialize the list containing all points on the interval
-        points: list[Point] = []
-
-        # Determine all points on the interval
-        for i in range(number_of_intervals + 1):
-            if x_constant:
-                points.append(Point(
-                    current_point.get_x_value(),
-                    self.get_intervals()[0].get_y_value() + i / number_of_intervals *
-                    abs(self.get_intervals()[1].get_y_value() -
-                        self.get_intervals()[0].get_y_value())))
-            else:
-                points.append(Point(
-                    self.get_intervals()[0].get_x_value() + i / number_of_intervals *
-                    abs(self.get_intervals()[1].get_x_value() -
-                        self.get_intervals()[0].get_x_value()),
-                    current_point.get_y_value())
-                )
-
         # Initialize the borders for the search as the interval of the function
         borders: tuple[int, int] = (0, number_of_intervals)
 
@@ -214,29 +474,97 @@ class Function(ABC):
         # Shrink the border from both sides until there is only one point left
         while borders[1] - borders[0] != 2:
             # Calculate the values of both points
-            value_left = self.get_value(
-                points[point_left].get_x_value(), points[point_left].get_y_value())
-            value_right = self.get_value(
-                points[point_right].get_x_value(), points[point_right].get_y_value())
+            left: Point = self.get_line_point(
+                point_left, number_of_intervals, x_constant, current_point)
+            right: Point = self.get_line_point(
+                point_right, number_of_intervals, x_constant, current_point)
+            value_left = self.get_value(left.get_x_value(), left.get_y_value())
+            value_right = self.get_value(right.get_x_value(), right.get_y_value())
 
             # Compare the two values and change the borders and points accordingly
-            if value_left < value_right:
-                borders = (borders[0], point_right)
-                point_right = borders[1] - (point_left - borders[0])
-            else:
-                borders = (point_left, borders[1])
-                point_left = borders[0] + (borders[1] - point_right)
-
-            # Switch points if right < left to ensure the correctness
-            if point_right < point_left:
-                point_left, point_right = point_right, point_left
+            borders, point_left, point_right = Function.__fibonacci_step(
+                borders, point_left, point_right, value_left < value_right)
 
         # Return the point that sits between the two interval ends
-        return points[borders[0] + 1]
+        return self.get_line_point(
+            borders[0] + 1, number_of_intervals, x_constant, current_point)
+
+    def get_line_point(self, index: int, number_of_intervals: int, x_constant: bool,
+                       current_point: Point) -> Point:
+        """
+        Get one of the evenly spaced points on a line through the intervals.
+
+        Parameters
+        ----------
+        index: int
+            Index of the point on the line, between 0 and the number of intervals.
+        number_of_intervals: int
+            Number of intervals the line is divided into.
+        x_constant: bool
+            Boolean indicating which variable of the function is constant.
+            If TRUE: The X variable is constant.
+            If FALSE: The Y variable is constant.
+        current_point: Point
+            The current point that is used to get the constant X/Y value.
+
+        Returns
+        -------
+        Point
+            The point with the specified index on the line.
+
+        """
+        if x_constant:
+            return Point(
+                current_point.get_x_value(),
+                self.get_intervals()[0].get_y_value() + index / number_of_intervals *
+                abs(self.get_intervals()[1].get_y_value() -
+                    self.get_intervals()[0].get_y_value()))
+
+        return Point(
+            self.get_intervals()[0].get_x_value() + index / number_of_intervals *
+            abs(self.get_intervals()[1].get_x_value() -
+                self.get_intervals()[0].get_x_value()),
+            current_point.get_y_value())
+
+    @staticmethod
+    def __fibonacci_step(borders: tuple[int, int], point_left: int, point_right: int,
+                         left_is_smaller: bool) -> tuple[tuple[int, int], int, int]:
+        """
+        Shrink the borders of the Fibonacci Search by one step.
+
+        Parameters
+        ----------
+        borders: tuple[int, int]
+            Current borders of the search.
+        point_left: int
+            Index of the left point.
+        point_right: int
+            Index of the right point.
+        left_is_smaller: bool
+            Boolean indicating whether the value at the left point is smaller.
+
+        Returns
+        -------
+        tuple[tuple[int, int], int, int]
+            The new borders, the new left point and the new right point.
+
+        """
+        if left_is_smaller:
+            borders = (borders[0], point_right)
+            point_right = borders[1] - (point_left - borders[0])
+        else:
+            borders = (point_left, borders[1])
+            point_left = borders[0] + (borders[1] - point_right)
+
+        # Switch points if right < left to ensure the correctness
+        if point_right < point_left:
+            point_left, point_right = point_right, point_left
+
+        return borders, point_left, point_right
 
     def edge_search(
-            self, starting_point: Point, distance: float,
-            number_of_steps: int) -> Point:
+            self, starting_point: Point, distance: float | None = None,
+            number_of_steps: int | None = None) -> Point:
         """
         Use the edge search method to determine a minimum.
 
@@ -244,13 +572,14 @@ class Function(ABC):
         ----------
         starting_point: Point
             Point from which the method starts.
-        distance: float
+        distance: float | None
             Distance in which two consecutive determined points need to be for the
-            method to stop.
-        number_of_steps: int
+            method to stop. Defaults to the value of the parameter profile.
+        number_of_steps: int | None
             The number of steps/calculations the method shall perform. This variable is
             also used to calculate the number of intervals and to calculate the
-            starting point in the interval.
+            starting point in the interval. Defaults to the value of the parameter
+            profile.
 
         Returns
         -------
@@ -258,16 +587,21 @@ class Function(ABC):
             Determined point of the minimum.
 
         """
+        # Use the parameters of the profile for all missing parameters
+        if distance is None or number_of_steps is None:
+            parameters: dict[str, float] = ParameterProfile.get_parameters(
+                self.get_profile_name(), "edge_search")
+            distance = parameters["distance"] if distance is None else distance
+            number_of_steps = (int(parameters["number_of_steps"])
+                               if number_of_steps is None else number_of_steps)
+
         # Initialize the last determined point as the starting point
         last_point: Point = starting_point
 
         # Determine new points until two consecutive points are in range of one another
         while True:
             # FInd the minimum on both the X and the Y scale
-            determined_point: Point = self.fibonacci_search(
-                number_of_steps, False, last_point)
-            determined_point: Point = self.fibonacci_search(
-                number_of_steps, True, determined_point)
+            determined_point: Point = self.edge_search_step(last_point, number_of_steps)
 
             # Break the loop if two points are in range to one another
             if Point.points_are_in_range(last_point, determined_point, distance):
@@ -277,3 +611,179 @@ class Function(ABC):
             last_point = determined_point
 
         return determined_point
+
+    def edge_search_step(self, last_point: Point, number_of_steps: int) -> Point:
+        """
+        Perform one sweep of the edge search method.
+
+        Parameters
+        ----------
+        last_point: Point
+            Point from which the sweep starts.
+        number_of_steps: int
+            The number of steps/calculations of both Fibonacci Searches.
+
+        Returns
+        -------
+        Point
+            Point after searching the minimum on the X and then on the Y scale.
+
+        """
+        determined_point: Point = self.fibonacci_search(
+            number_of_steps, False, last_point)
+
+        return self.fibonacci_search(number_of_steps, True, determined_point)
+
+    def batched_edge_search(
+            self, starting_points: list[Point], distance: float,
+            number_of_steps: int) -> list[Point]:
+        """
+        Use the edge search method from multiple starting points at once.
+
+        Every starting point is a lane of its own. Since the Fibonacci Search takes
+        the same number of steps for every line, the line searches of all lanes
+        advance in lockstep and their left and right points are evaluated together
+        with one call of get_values per step. A lane is retired as soon as two of
+        its consecutive determined points are in range of one another.
+
+        Parameters
+        ----------
+        starting_points: list[Point]
+            Points from which the method starts.
+        distance: float
+            Distance in which two consecutive determined points need to be for a lane
+            to stop.
+        number_of_steps: int
+            The number of steps/calculations the method shall perform. This variable is
+            also used to calculate the number of intervals and to calculate the
+            starting point in the interval.
+
+        Returns
+        -------
+        determined_points: list[Point]
+            Determined points of the minima in the order of the starting points.
+
+        """
+        # Initialize the last determined points as the starting points
+        last_points: list[Point] = list(starting_points)
+        determined_points: list[Point] = list(starting_points)
+
+        # Indices of the lanes that have not converged yet
+        active: list[int] = list(range(len(starting_points)))
+
+        # Determine new points until all lanes have converged
+        while active:
+            # Find the minima on both the X and the Y scale for all active lanes
+            points: list[Point] = self.__batched_fibonacci_search(
+                number_of_steps, False, [last_points[lane] for lane in active])
+            points = self.__batched_fibonacci_search(number_of_steps, True, points)
+
+            # Retire the lanes whose two points are in range to one another
+            remaining: list[int] = []
+            for lane, point in zip(active, points):
+                if Point.points_are_in_range(last_points[lane], point, distance):
+                    determined_points[lane] = point
+                else:
+                    last_points[lane] = point
+                    remaining.append(lane)
+            active = remaining
+
+        return determined_points
+
+    def __batched_fibonacci_search(self, number_of_steps: int, x_constant: bool,
+                                   current_points: list[Point]) -> list[Point]:
+        """
+        Use the Fibonacci Search on multiple lines in lockstep.
+
+        Parameters
+        ----------
+        number_of_steps: int
+            The number of steps/calculations the method shall perform.
+        x_constant: bool
+            Boolean indicating which variable of the function is constant.
+        current_points: list[Point]
+            The current points that are used to get the constant X/Y values.
+
+        Returns
+        -------
+        list[Point]
+            Determined points of the minima of all lines.
+
+        """
+        lanes: int = len(current_points)
+        number_of_intervals: int = Function.get_fibonacci_number(number_of_steps + 2)
+        start: int = Function.get_fibonacci_number(number_of_steps)
+
+        # All lanes share the same schedule, so their borders have the same width
+        borders: list[tuple[int, int]] = [(0, number_of_intervals)] * lanes
+        points_left: list[int] = [start] * lanes
+        points_right: list[int] = [number_of_intervals - start] * lanes
+
+        while lanes and borders[0][1] - borders[0][0] != 2:
+            # Evaluate the left and right points of all lanes at once
+            probes: list[Point] = [
+                self.get_line_point(index, number_of_intervals, x_constant, point)
+                for indices in (points_left, points_right)
+                for index, point in zip(indices, current_points)]
+            values: list[float] = self.get_values(
+                [probe.get_x_value() for probe in probes],
+                [probe.get_y_value() for probe in probes])
+
+            # Shrink the borders of every lane
+            for lane in range(lanes):
+                borders[lane], points_left[lane], points_right[lane] = \
+                    Function.__fibonacci_step(
+                        borders[lane], points_left[lane], points_right[lane],
+                        values[lane] < values[lanes + lane])
+
+        return [self.get_line_point(
+            border[0] + 1, number_of_intervals, x_constant, point)
+            for border, point in zip(borders, current_points)]
+
+    def evaluate_points(self, points: list[Point], use_batch: bool) -> list[float]:
+        """
+        Calculate the values of the function at multiple points.
+
+        Parameters
+        ----------
+        points: list[Point]
+            Points at which the function is evaluated.
+        use_batch: bool
+            Boolean indicating whether the points are evaluated via get_values.
+
+        Returns
+        -------
+        list[float]
+            Values of the function at the specified points.
+
+        """
+        if use_batch:
+            return self.get_values([point.get_x_value() for point in points],
+                                   [point.get_y_value() for point in points])
+
+        return [self.get_value(point.get_x_value(), point.get_y_value())
+                for point in points]
+
+    def clamp_point(self, point: Point) -> Point:
+        """
+        Move a point onto the closest point within the intervals of the function.
+
+        Parameters
+        ----------
+        point: Point
+            Point that shall be moved.
+
+        Returns
+        -------
+        Point
+            Closest point within the intervals of the function.
+
+        """
+        lower: Point = self.get_intervals()[0]
+        upper: Point = self.get_intervals()[1]
+
+        return Point(
+            min(max(point.get_x_value(), min(lower.get_x_value(), upper.get_x_value())),
+                max(lower.get_x_value(), upper.get_x_value())),
+            min(max(point.get_y_value(), min(lower.get_y_value(), upper.get_y_value())),
+                max(lower.get_y_value(), upper.get_y_value())))
@@ -0,0 +1,155 @@
+"""File containing the class for the ill-conditioned quadratic benchmark function."""
+
+# Import trigonometric functions
+from math import cos, pi, sin
+
+# Import used classes
+from classes.benchmark_function import BenchmarkFunction
+from classes.vector import Vector
+from classes.point import Point
+
+class IllConditionedQuadratic(BenchmarkFunction):
+    """
+    Ill-conditioned quadratic benchmark function.
+
+    The function is defined as follows, with u and v being x and y rotated by an
+    angle: u^2 + condition * v^2
+
+    Attributes
+    ----------
+    condition: float
+        Ratio between the largest and the smallest curvature of the function.
+    angle: float
+        Angle in radians by which the axes of the function are rotated.
+
+    Methods
+    -------
+    get_condition
+        Return the ratio between the largest and the smallest curvature.
+    get_angle
+        Return the angle by which the axes of the function are rotated.
+    get_value
+        Calculate the value of a two dimensional function at a point.
+    get_values
+        Calculate the values of the function at multiple points.
+    get_gradient
+        Get the value of the gradient at a specified point.
+
+    """
+
+    INTERVALS: list[Point] = [Point(-2.0, -2.0), Point(2.0, 2.0)]
+    KNOWN_MINIMA: list[Point] = [Point(0.0, 0.0)]
+
+    def __init__(self, intervals: list[Point] | None = None, condition: float = 1000.0,
+                 angle: float = pi / 6) -> None:
+        """
+        Construct one object of the function with the given parameters.
+
+        Parameters
+        ----------
+        intervals: list[Point] | None
+            The two corner points of the interval of the function. Defaults to the
+            recommended intervals.
+        condition: float
+            Ratio between the largest and the smallest curvature of the function.
+        angle: float
+            Angle in radians by which the axes of the function are rotated.
+
+        """
+        super().__init__(intervals)
+        self.__condition: float = condition
+        self.__angle: float = angle
+        self.__cos: float = cos(angle)
+        self.__sin: float = sin(angle)
+
+    def get_condition(self) -> float:
+        """
+        Return the ratio between the largest and the smallest curvature.
+
+        Returns
+        -------
+        condition: float
+            Ratio between the largest and the smallest curvature of the function.
+
+        """
+        return self.__condition
+
+    def get_angle(self) -> float:
+        """
+        Return the angle by which the axes of the function are rotated.
+
+        Returns
+        -------
+        angle: float
+            Angle in radians by which the axes of the function are rotated.
+
+        """
+        return self.__angle
+
+    def get_value(self, x_value: float, y_value: float) -> float:
+        """
+        Calculate the value of a two dimensional function at a point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        float
+            Value of the function at the specified point.
+
+        """
+        u_value: float = self.__cos * x_value + self.__sin * y_value
+        v_value: float = -self.__sin * x_value + self.__cos * y_value
+
+        return u_value ** 2 + self.__condition * v_value ** 2
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the function at multiple points.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the function at the specified points.
+
+        """
+        cosine, sine, condition = self.__cos, self.__sin, self.__condition
+
+        return [(cosine * x + sine * y) ** 2 + condition * (cosine * y - sine * x) ** 2
+                for x, y in zip(x_values, y_values)]
+
+    def get_gradient(self, x_value: float, y_value: float) -> Vector:
+        """
+        Get the value of the gradient at a specified point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        Vector
+            Values of the gradient at the specified point.
+
+        """
+        u_value: float = self.__cos * x_value + self.__sin * y_value
+        v_value: float = -self.__sin * x_value + self.__cos * y_value
+
+        return Vector(
+            2 * u_value * self.__cos - 2 * self.__condition * v_value * self.__sin,
+            2 * u_value * self.__sin + 2 * self.__condition * v_value * self.__cos)
@@ -0,0 +1,286 @@
+"""File containing the class MinimaCollection."""
+
+# Import used Python libraries
+from math import floor
+
+# Import used classes
+from classes.function import Function
+from classes.point import Point
+
+class MinimaCollection:
+    """
+    Class collecting the minima found by many runs of a method.
+
+    Found minima that are in range of an already known basin are merged into it.
+    The basins are stored in a uniform grid hash whose cells are as wide as the
+    tolerance, so every lookup only checks the basins of the nine surrounding cells
+    instead of all known basins.
+
+    Attributes
+    ----------
+    function: Function
+        The function whose minima are collected.
+    tolerance: float
+        Distance in which a found minimum needs to be to a basin to be merged into it.
+    patience: int | None
+        Number of consecutive found minima without a new basin after which the
+        collection is saturated.
+
+    Methods
+    -------
+    get_function
+        Return the function whose minima are collected.
+    get_tolerance
+        Return the tolerance used to merge found minima.
+    add
+        Add a found minimum to the collection.
+    add_all
+        Add found minima to the collection until it is saturated.
+    is_saturated
+        Check if no new basin has been found for a number of consecutive minima.
+    get_minima
+        Return the best point of every basin.
+    get_values
+        Return the best value of every basin.
+    get_hit_counts
+        Return how often every basin has been found.
+    get_best
+        Return the best point of all basins.
+
+    """
+
+    def __init__(self, function: Function, tolerance: float,
+                 patience: int | None = None) -> None:
+        """
+        Construct one empty collection with the given parameters.
+
+        Parameters
+        ----------
+        function: Function
+            The function whose minima are collected.
+        tolerance: float
+            Distance in which a found minimum needs to be to a basin to be merged
+            into it.
+        patience: int | None
+            Number of consecutive found minima without a new basin after which the
+            collection is saturated. None disables the saturation.
+
+        """
+        if tolerance <= 0:
+            raise ValueError("The tolerance needs to be positive")
+
+        self.__function: Function = function
+        self.__tolerance: float = tolerance
+        self.__patience: int | None = patience
+        # Center, best point, best value and hit count of every basin
+        self.__basins: list[tuple[Point, Point, float, int]] = []
+        self.__cells: dict[tuple[int, int], list[int]] = {}
+        self.__since_new: int = 0
+
+    def get_function(self) -> Function:
+        """
+        Return the function whose minima are collected.
+
+        Returns
+        -------
+        function: Function
+            The function whose minima are collected.
+
+        """
+        return self.__function
+
+    def get_tolerance(self) -> float:
+        """
+        Return the tolerance used to merge found minima.
+
+        Returns
+        -------
+        tolerance: float
+            Distance in which a found minimum needs to be to a basin to be merged
+            into it.
+
+        """
+        return self.__tolerance
+
+    def add(self, point: Point, value: float | None = None) -> bool:
+        """
+        Add a found minimum to the collection.
+
+        Parameters
+        ----------
+        point: Point
+            The found minimum.
+        value: float | None
+            Value of the function at the found minimum. It is calculated if omitted.
+
+        Returns
+        -------
+        bool
+            True if the found minimum opened a new basin, False if it was merged.
+
+        """
+        if value is None:
+            value = self.get_function().get_value(
+                point.get_x_value(), point.get_y_value())
+
+        cell: tuple[int, int] = self.__get_cell(point)
+        basin: int | None = self.__find_basin(point, cell)
+
+        # Merge the found minimum into the known basin
+        if basin is not None:
+            center, minimum, best_value, hits = self.__basins[basin]
+            if value < best_value:
+                minimum, best_value = point, value
+            self.__basins[basin] = (center, minimum, best_value, hits + 1)
+            self.__since_new += 1
+            return False
+
+        # Open a new basin around the found minimum
+        self.__cells.setdefault(cell, []).append(len(self.__basins))
+        self.__basins.append((point, point, value, 1))
+        self.__since_new = 0
+        return True
+
+    def add_all(self, points: list[Point]) -> int:
+        """
+        Add found minima to the collection until it is saturated.
+
+        The value of a found minimum is only calculated once it is added, so no
+        evaluations are spent on the minima after the saturation.
+
+        Parameters
+        ----------
+        points: list[Point]
+            The found minima.
+
+        Returns
+        -------
+        added: int
+            Number of added minima, smaller than the number of points if the
+            collection became saturated.
+
+        """
+        added: int = 0
+
+        for point in points:
+            if self.is_saturated():
+                break
+            self.add(point)
+            added += 1
+
+        return added
+
+    def is_saturated(self) -> bool:
+        """
+        Check if no new basin has been found for a number of consecutive minima.
+
+        Returns
+        -------
+        bool
+            True if the patience is set and has been exceeded, False otherwise.
+
+        """
+        return self.__patience is not None and self.__since_new >= self.__patience
+
+    def get_minima(self) -> list[Point]:
+        """
+        Return the best point of every basin.
+
+        Returns
+        -------
+        list[Point]
+            The best point of every basin in the order the basins were found.
+
+        """
+        return [basin[1] for basin in self.__basins]
+
+    def get_values(self) -> list[float]:
+        """
+        Return the best value of every basin.
+
+        Returns
+        -------
+        list[float]
+            The best value of every basin in the order the basins were found.
+
+        """
+        return [basin[2] for basin in self.__basins]
+
+    def get_hit_counts(self) -> list[int]:
+        """
+        Return how often every basin has been found.
+
+        Returns
+        -------
+        list[int]
+            The number of found minima of every basin in the order the basins were
+            found.
+
+        """
+        return [basin[3] for basin in self.__basins]
+
+    def get_best(self) -> Point | None:
+        """
+        Return the best point of all basins.
+
+        Returns
+        -------
+        Point | None
+            The point with the lowest value or None if the collection is empty.
+
+        """
+        if not self.__basins:
+            return None
+
+        return min(self.__basins, key=lambda basin: basin[2])[1]
+
+    def __get_cell(self, point: Point) -> tuple[int, int]:
+        """
+        Get the grid cell containing a point.
+
+        Parameters
+        ----------
+        point: Point
+            The point.
+
+        Returns
+        -------
+        tuple[int, int]
+            Column and row of the cell.
+
+        """
+        return (floor(point.get_x_value() / self.__tolerance),
+                floor(point.get_y_value() / self.__tolerance))
+
+    def __find_basin(self, point: Point, cell: tuple[int, int]) -> int | None:
+        """
+        Find the closest known basin in range of a point.
+
+        Parameters
+        ----------
+        point: Point
+            The point.
+        cell: tuple[int, int]
+            The grid cell containing the point.
+
+        Returns
+        -------
+        int | None
+            Index of the closest basin or None if no basin is in range.
+
+        """
+        closest: int | None = None
+        closest_distance: float = self.__tolerance
+
+        # Only the surrounding cells can contain basins in range of the point
+        for column in range(cell[0] - 1, cell[0] + 2):
+            for row in range(cell[1] - 1, cell[1] + 2):
+                for basin in self.__cells.get((column, row), []):
+                    center: Point = self.__basins[basin][0]
+                    current: float = (
+                        (center.get_x_value() - point.get_x_value()) ** 2 +
+                        (center.get_y_value() - point.get_y_value()) ** 2) ** .5
+                    if current <= closest_distance:
+                        closest, closest_distance = basin, current
+
+        return closest
@@ -0,0 +1,446 @@
+"""File containing the class OptimizationService."""
+
+# Import used Python libraries
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Pipe, Process, parent_process
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from queue import Empty, Queue
+from socketserver import BaseServer, ThreadingUnixStreamServer
+from threading import BoundedSemaphore, Lock
+from typing import Callable
+
+# Import used classes
+from classes.function import Function
+from classes.function1 import Function1
+from classes.function2 import Function2
+from classes.function3 import Function3
+from classes.point import Point
+from classes.simplex_search import SimplexSearch
+from classes.surrogate_function import SurrogateFunction
+
+class OptimizationService:
+    """
+    Long-running service answering optimization requests over HTTP.
+
+    The service listens on a localhost port or a Unix domain socket and forwards
+    every request to one of its warm worker processes. The workers keep their
+    function objects and an evaluation cache alive between requests, the service
+    keeps a cache of the latest results. A worker that exceeds the timeout of a
+    request is killed and replaced by a fresh one. Requests are answered with POST
+    /optimize and a JSON body such as:
+    {"function": 1, "method": "edge_search", "x": 1.0, "y": 1.0, "distance": 0.01,
+    "number_of_steps": 30, "factor": 0.1, "timeout": 5.0}
+
+    Attributes
+    ----------
+    intervals: dict[int, list[Point]]
+        Intervals of all functions the service can optimize.
+    workers: int
+        Number of worker processes.
+    queue_size: int
+        Maximal number of requests that are queued or processed at once.
+    cache_size: int
+        Maximal number of results kept in the result cache.
+
+    Methods
+    -------
+    get_intervals
+        Return the intervals of all functions the service can optimize.
+    handle
+        Answer one optimization request.
+    serve
+        Listen for requests until the service is interrupted.
+    validate
+        Check the parameters of one optimization request.
+    run_worker
+        Answer optimization requests in a worker process until its pipe is closed.
+    initialize_worker
+        Build the function objects of one worker process.
+    solve
+        Execute one optimization request in a worker process.
+
+    """
+
+    # Methods that can be requested
+    METHODS: tuple[str, ...] = (
+        "edge_search", "gradient_descend", "nelder_mead_search")
+    # Maximal number of cached evaluations per function in every worker
+    EVALUATION_CACHE_SIZE: int = 100000
+    # Function objects of the current worker process
+    worker_functions: dict[int, SurrogateFunction] = {}
+
+    def __init__(self, intervals: dict[int, list[Point]], workers: int | None = None,
+                 queue_size: int = 64, cache_size: int = 1024) -> None:
+        """
+        Construct one service with the given parameters and start its workers.
+
+        Parameters
+        ----------
+        intervals: dict[int, list[Point]]
+            Intervals of all functions the service can optimize.
+        workers: int | None
+            Number of worker processes. Defaults to the number of CPUs.
+        queue_size: int
+            Maximal number of requests that are queued or processed at once.
+        cache_size: int
+            Maximal number of results kept in the result cache.
+
+        """
+        self.__intervals: dict[int, list[Point]] = intervals
+        self.__cache_size: int = cache_size
+        self.__cache: OrderedDict[str, dict] = OrderedDict()
+        self.__cache_lock: Lock = Lock()
+        self.__queue: BoundedSemaphore = BoundedSemaphore(queue_size)
+        self.__idle: Queue[tuple[Process, Connection]] = Queue()
+        for _ in range(workers or os.cpu_count() or 1):
+            self.__idle.put(self.__start_worker())
+
+    def get_intervals(self) -> dict[int, list[Point]]:
+        """
+        Return the intervals of all functions the service can optimize.
+
+        Returns
+        -------
+        intervals: dict[int, list[Point]]
+            Intervals of all functions the service can optimize.
+
+        """
+        return self.__intervals
+
+    def handle(self, request: dict) -> tuple[int, dict]:
+        """
+        Answer one optimization request.
+
+        Parameters
+        ----------
+        request: dict
+            The decoded JSON body of the request.
+
+        Returns
+        -------
+        tuple[int, dict]
+            HTTP status code and JSON body of the answer.
+
+        """
+        # Validate the request
+        error: str | None = OptimizationService.validate(
+            request, self.get_intervals())
+        if error is not None:
+            return 400, {"error": error}
+
+        # Answer the request from the result cache if possible
+        timeout: float = float(request.pop("timeout", 30.0))
+        key: str = json.dumps(request, sort_keys=True)
+        with self.__cache_lock:
+            if key in self.__cache:
+                self.__cache.move_to_end(key)
+                return 200, self.__cache[key]
+
+        # Reject the request if the queue is full, a taken slot is released below
+        # pylint: disable-next=consider-using-with
+        if not self.__queue.acquire(blocking=False):
+            return 503, {"error": "Too many queued requests"}
+
+        try:
+            status, result = self.__execute(request, timeout)
+        finally:
+            self.__queue.release()
+
+        # Store the result in the cache and drop the oldest one if it is full
+        if status != 200:
+            return status, result
+        with self.__cache_lock:
+            self.__cache[key] = result
+            if len(self.__cache) > self.__cache_size:
+                self.__cache.popitem(last=False)
+
+        return 200, result
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8000,
+              socket_path: str | None = None) -> None:
+        """
+        Listen for requests until the service is interrupted.
+
+        Parameters
+        ----------
+        host: str
+            Host the HTTP server listens on.
+        port: int
+            Port the HTTP server listens on.
+        socket_path: str | None
+            Path of a Unix domain socket to listen on instead of the port.
+
+        """
+        service: OptimizationService = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Handler forwarding HTTP requests to the service."""
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                """Answer one POST request."""
+                try:
+                    request: dict = json.loads(self.rfile.read(
+                        int(self.headers.get("Content-Length", 0))))
+                    status, body = service.handle(request)
+                except (ValueError, AttributeError):
+                    status, body = 400, {"error": "The body is not a JSON object"}
+                data: bytes = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def address_string(self) -> str:
+                """Return the client address, which is empty for Unix sockets."""
+                return str(self.client_address[0]) if self.client_address else "unix"
+
+            # pylint: disable-next=redefined-builtin
+            def log_message(self, format, *args) -> None:
+                """Log every request on the debug level instead of to stderr."""
+                logging.getLogger(__name__).debug(format, *args)
+
+        server: BaseServer
+        if socket_path is None:
+            server = ThreadingHTTPServer((host, port), Handler)
+        else:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+            server = ThreadingUnixStreamServer(socket_path, Handler)
+
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+            # Stop all idle workers, busy ones end together with the service
+            while not self.__idle.empty():
+                OptimizationService.__stop_worker(self.__idle.get_nowait())
+
+    @staticmethod
+    def validate(request: dict, intervals: dict[int, list[Point]]) -> str | None:
+        """
+        Check the parameters of one optimization request.
+
+        Parameters
+        ----------
+        request: dict
+            The decoded JSON body of the request.
+        intervals: dict[int, list[Point]]
+            Intervals of all functions that can be optimized.
+
+        Returns
+        -------
+        str | None
+            Description of the first invalid parameter, None if the request is valid.
+
+        """
+        if (request.get("function") not in intervals or
+                request.get("method") not in OptimizationService.METHODS):
+            return "Unknown function or method"
+
+        # All parameters besides the function and the method are numbers
+        for name, value in request.items():
+            if name not in ("function", "method") and (
+                    isinstance(value, bool) or not isinstance(value, (int, float))):
+                return f"The parameter {name} is not a number"
+
+        # Distances, factors and timeouts need to be positive
+        for name in ("distance", "factor", "timeout"):
+            if name in request and not request[name] > 0:
+                return f"The parameter {name} needs to be positive"
+
+        # The Fibonacci Search needs at least two intervals to terminate
+        if "number_of_steps" in request and not (
+                isinstance(request["number_of_steps"], int) and
+                request["number_of_steps"] >= 2):
+            return "The parameter number_of_steps needs to be an integer of at least 2"
+
+        return None
+
+    def __execute(self, request: dict, timeout: float) -> tuple[int, dict]:
+        """
+        Let an idle worker answer a validated request within the timeout.
+
+        A worker that has not answered within the timeout is killed, as the running
+        method can not be interrupted otherwise, and replaced by a fresh worker.
+
+        Parameters
+        ----------
+        request: dict
+            The validated request.
+        timeout: float
+            Number of seconds after which the request is aborted, including the time
+            spent waiting for an idle worker.
+
+        Returns
+        -------
+        tuple[int, dict]
+            HTTP status code and JSON body of the answer.
+
+        """
+        deadline: float = time.monotonic() + timeout
+
+        # Wait for an idle worker
+        try:
+            worker: tuple[Process, Connection] = self.__idle.get(timeout=timeout)
+        except Empty:
+            return 504, {"error": "The request timed out"}
+
+        try:
+            worker[1].send(request)
+            if worker[1].poll(max(0.0, deadline - time.monotonic())):
+                answer: tuple[int, dict] = worker[1].recv()
+                self.__idle.put(worker)
+                return answer
+            status, body = 504, {"error": "The request timed out"}
+        except (EOFError, OSError):
+            status, body = 500, {"error": "The worker process has died"}
+
+        # Replace the worker, as it is still busy with the aborted request or dead
+        OptimizationService.__stop_worker(worker)
+        self.__idle.put(self.__start_worker())
+
+        return status, body
+
+    def __start_worker(self) -> tuple[Process, Connection]:
+        """
+        Start one worker process.
+
+        Returns
+        -------
+        tuple[Process, Connection]
+            The worker process and the end of its pipe used by the service.
+
+        """
+        connection, worker_connection = Pipe()
+        process: Process = Process(
+            target=OptimizationService.run_worker,
+            args=(worker_connection, self.get_intervals()), daemon=True)
+        process.start()
+        worker_connection.close()
+
+        return process, connection
+
+    @staticmethod
+    def __stop_worker(worker: tuple[Process, Connection]) -> None:
+        """
+        Kill one worker process and close its pipe.
+
+        Parameters
+        ----------
+        worker: tuple[Process, Connection]
+            The worker process and the end of its pipe used by the service.
+
+        """
+        worker[0].kill()
+        worker[0].join()
+        worker[1].close()
+
+    @staticmethod
+    def run_worker(connection: Connection, intervals: dict[int, list[Point]]) -> None:
+        """
+        Answer optimization requests in a worker process until its pipe is closed.
+
+        The worker also stops once the service has ended.
+
+        Parameters
+        ----------
+        connection: Connection
+            The end of the pipe used by the worker.
+        intervals: dict[int, list[Point]]
+            Intervals of all functions the service can optimize.
+
+        """
+        OptimizationService.initialize_worker(intervals)
+        parent: BaseProcess | None = parent_process()
+
+        while True:
+            # Stop once the service has ended, other workers may still hold its pipe
+            if parent is not None and connection not in wait(
+                    [connection, parent.sentinel]):
+                break
+            try:
+                request: dict = connection.recv()
+            except EOFError:
+                break
+
+            # Answer every failure of a method instead of ending the worker
+            try:
+                connection.send((200, OptimizationService.solve(request)))
+            except (KeyError, TypeError, ValueError) as error:
+                connection.send((400, {"error": str(error)}))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                connection.send((500, {"error": f"{type(error).__name__}: {error}"}))
+
+    @staticmethod
+    def initialize_worker(intervals: dict[int, list[Point]]) -> None:
+        """
+        Build the function objects of one worker process.
+
+        Parameters
+        ----------
+        intervals: dict[int, list[Point]]
+            Intervals of all functions the service can optimize.
+
+        """
+        classes: dict[int, Callable[[list[Point]], Function]] = {
+            1: Function1, 2: Function2, 3: Function3}
+        OptimizationService.worker_functions = {
+            number: SurrogateFunction(classes[number](interval))
+            for number, interval in intervals.items()}
+
+    @staticmethod
+    def solve(request: dict) -> dict:
+        """
+        Execute one optimization request in a worker process.
+
+        The functions cache all their evaluations, the cache is cleared once it
+        exceeds EVALUATION_CACHE_SIZE entries.
+
+        Parameters
+        ----------
+        request: dict
+            The validated request.
+
+        Returns
+        -------
+        dict
+            The found minimum and its value.
+
+        """
+        function: SurrogateFunction = \
+            OptimizationService.worker_functions[request["function"]]
+        if len(function.get_archive()) > OptimizationService.EVALUATION_CACHE_SIZE:
+            function.get_archive().clear()
+
+        starting_point: Point = Point(
+            float(request.get("x", 1.0)), float(request.get("y", 1.0)))
+        # Omitted parameters are completed from the parameter profile by the methods
+        distance: float | None = \
+            float(request["distance"]) if "distance" in request else None
+
+        # Execute the requested method
+        if request["method"] == "edge_search":
+            found_min: Point = function.edge_search(
+                starting_point, distance,
+                int(request["number_of_steps"]) if "number_of_steps" in request
+                else None)
+        elif request["method"] == "gradient_descend":
+            found_min = function.gradient_descend(
+                starting_point, distance,
+                float(request["factor"]) if "factor" in request else None)
+        else:
+            # The Nelder-Mead method has no entry in the profile
+            found_min = SimplexSearch(function).nelder_mead_search(
+                starting_point, 0.01 if distance is None else distance)
+
+        return {"x": found_min.get_x_value(), "y": found_min.get_y_value(),
+                "value": function.get_value(
+                    found_min.get_x_value(), found_min.get_y_value())}
@@ -0,0 +1,127 @@
+"""File containing the class ParameterProfile."""
+
+# Import used Python libraries
+import json
+import os
+from pathlib import Path
+
+class ParameterProfile:
+    """
+    Class providing the tuned parameters of the methods for every function.
+
+    The profile is a JSON file written by the ParameterTuner. It maps the name of a
+    function class and the name of a method to the selected parameters, e.g.
+    {"Function1": {"gradient_descend": {"selected": {"distance": 0.01,
+    "factor": 0.1}, "pareto": [...]}}}
+    The file is read from the path in the environment variable
+    NON_LINEAR_SEARCH_PROFILE or from 'tuning_profile.json' in the source
+    directory. Parameters missing in the profile fall back to the defaults. The
+    file is read once per process for get_parameters, saving it refreshes the
+    cached profile.
+
+    Methods
+    -------
+    get_path
+        Return the path of the profile file.
+    load
+        Read the profile file.
+    save
+        Write the profile file.
+    get_parameters
+        Return the parameters of a method for a function.
+
+    """
+
+    # Parameters used if the profile does not contain a function or method
+    DEFAULTS: dict[str, dict[str, float]] = {
+        "gradient_descend": {"distance": 0.01, "factor": 0.1},
+        "edge_search": {"distance": 0.01, "number_of_steps": 30},
+    }
+    # Environment variable overriding the path of the profile file
+    ENVIRONMENT_VARIABLE: str = "NON_LINEAR_SEARCH_PROFILE"
+    # Profiles already read by get_parameters, keyed by the path of their file
+    cached_profiles: dict[str, dict] = {}
+
+    @staticmethod
+    def get_path() -> str:
+        """
+        Return the path of the profile file.
+
+        Returns
+        -------
+        str
+            The path of the profile file.
+
+        """
+        return os.environ.get(
+            ParameterProfile.ENVIRONMENT_VARIABLE,
+            str(Path(__file__).resolve().parent.parent / "tuning_profile.json"))
+
+    @staticmethod
+    def load(path: str | None = None) -> dict:
+        """
+        Read the profile file.
+
+        Parameters
+        ----------
+        path: str | None
+            Path of the profile file, defaults to get_path.
+
+        Returns
+        -------
+        dict
+            The profile or an empty dictionary if the file does not exist.
+
+        """
+        path = path or ParameterProfile.get_path()
+        if not os.path.exists(path):
+            return {}
+
+        with open(path, encoding="utf-8") as profile:
+            return json.load(profile)
+
+    @staticmethod
+    def save(profile: dict, path: str | None = None) -> None:
+        """
+        Write the profile file.
+
+        Parameters
+        ----------
+        profile: dict
+            The profile.
+        path: str | None
+            Path of the profile file, defaults to get_path.
+
+        """
+        path = path or ParameterProfile.get_path()
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(profile, file, indent=2)
+        ParameterProfile.cached_profiles[path] = profile
+
+    @staticmethod
+    def get_parameters(function_name: str, method: str) -> dict[str, float]:
+        """
+        Return the parameters of a method for a function.
+
+        Parameters
+        ----------
+        function_name: str
+            Name of the class of the function.
+        method: str
+            Either 'gradient_descend' or 'edge_search'.
+
+        Returns
+        -------
+        dict[str, float]
+            The selected parameters of the profile completed by the defaults.
+
+        """
+        # Read the profile file only the first time it is needed
+        path: str = ParameterProfile.get_path()
+        if path not in ParameterProfile.cached_profiles:
+            ParameterProfile.cached_profiles[path] = ParameterProfile.load(path)
+
+        selected: dict = ParameterProfile.cached_profiles[path].get(
+            function_name, {}).get(method, {}).get("selected", {})
+
+        return {**ParameterProfile.DEFAULTS[method], **selected}
@@ -0,0 +1,307 @@
+"""File containing the class ParameterTuner."""
+
+# Import used Python libraries
+import time
+from itertools import product
+from multiprocessing import Pool
+from random import Random
+
+# Import used classes
+from classes.counting_function import CountingFunction
+from classes.function import Function
+from classes.point import Point
+
+class ParameterTuner:
+    """
+    Class sweeping the parameters of the methods for one function.
+
+    Every setting of the parameter grid is executed from the same sample of
+    starting points, the settings are distributed to multiple processes. For each
+    setting the average number of evaluations (values and gradients), the average
+    wall time and the average error are measured. The error is the distance to the
+    point the same method determines from the same starting point with a very tight
+    reference setting. The settings that are not dominated in all three measures
+    form the Pareto front.
+
+    Attributes
+    ----------
+    function: Function
+        The function whose parameters are tuned.
+    starting_points: list[Point]
+        The sample of starting points.
+
+    Methods
+    -------
+    get_function
+        Return the function whose parameters are tuned.
+    get_starting_points
+        Return the sample of starting points.
+    tune
+        Measure all settings of the grid of a method.
+    get_pareto_front
+        Return the settings that are not dominated by any other setting.
+    select
+        Select the cheapest setting of a Pareto front that reaches a target error.
+    create_profile
+        Tune all methods and create the profile entry of the function.
+    measure
+        Measure one setting from all starting points.
+
+    """
+
+    # Parameter grids of the tuned methods
+    GRIDS: dict[str, dict[str, list[float]]] = {
+        "gradient_descend": {
+            "distance": [0.1, 0.05, 0.01, 0.005, 0.001],
+            "factor": [1.0, 0.5, 0.1, 0.05, 0.01]},
+        "edge_search": {
+            "distance": [0.1, 0.05, 0.01, 0.005, 0.001],
+            "number_of_steps": [10, 15, 20, 25, 30]},
+    }
+    # Tight settings determining the reference points of the methods
+    REFERENCES: dict[str, dict[str, float]] = {
+        "gradient_descend": {"distance": 0.0001, "factor": 0.01},
+        "edge_search": {"distance": 0.0001, "number_of_steps": 35},
+    }
+
+    def __init__(self, function: Function, number_of_starts: int = 10,
+                 seed: int | None = 0) -> None:
+        """
+        Construct one tuner with random starting points within the intervals.
+
+        Parameters
+        ----------
+        function: Function
+            The function whose parameters are tuned.
+        number_of_starts: int
+            Number of random starting points.
+        seed: int | None
+            Seed of the random starting points.
+
+        """
+        random: Random = Random(seed)
+        lower, upper = function.get_intervals()
+
+        self.__function: Function = function
+        self.__starting_points: list[Point] = [
+            Point(random.uniform(lower.get_x_value(), upper.get_x_value()),
+                  random.uniform(lower.get_y_value(), upper.get_y_value()))
+            for _ in range(number_of_starts)]
+
+    def get_function(self) -> Function:
+        """
+        Return the function whose parameters are tuned.
+
+        Returns
+        -------
+        function: Function
+            The function whose parameters are tuned.
+
+        """
+        return self.__function
+
+    def get_starting_points(self) -> list[Point]:
+        """
+        Return the sample of starting points.
+
+        Returns
+        -------
+        starting_points: list[Point]
+            The sample of starting points.
+
+        """
+        return self.__starting_points
+
+    def tune(self, method: str, processes: int | None = None) -> list[dict]:
+        """
+        Measure all settings of the grid of a method.
+
+        Parameters
+        ----------
+        method: str
+            Either 'gradient_descend' or 'edge_search'.
+        processes: int | None
+            Number of worker processes. Defaults to the number of CPUs.
+
+        Returns
+        -------
+        list[dict]
+            The parameters and the measures 'evaluations', 'seconds' and 'error' of
+            every setting.
+
+        """
+        grid: dict[str, list[float]] = ParameterTuner.GRIDS[method]
+        settings: list[dict] = [dict(zip(grid, values))
+                                for values in product(*grid.values())]
+
+        # Determine the reference points with the tight setting
+        references: list[Point | None] = ParameterTuner.__run(
+            self.get_function(), method, ParameterTuner.REFERENCES[method],
+            self.get_starting_points())[0]
+
+        jobs: list[tuple] = [
+            (self.get_function(), method, setting, self.get_starting_points(),
+             references) for setting in settings]
+        with Pool(processes) as pool:
+            return pool.map(ParameterTuner.measure, jobs)
+
+    @staticmethod
+    def get_pareto_front(results: list[dict]) -> list[dict]:
+        """
+        Return the settings that are not dominated by any other setting.
+
+        A setting dominates another one if it is not worse in evaluations, seconds
+        and error and better in at least one of them.
+
+        Parameters
+        ----------
+        results: list[dict]
+            The measured settings as returned by tune.
+
+        Returns
+        -------
+        list[dict]
+            The Pareto-optimal settings sorted by their evaluations.
+
+        """
+        measures: tuple[str, ...] = ("evaluations", "seconds", "error")
+
+        def dominates(first: dict, second: dict) -> bool:
+            return (all(first[key] <= second[key] for key in measures) and
+                    any(first[key] < second[key] for key in measures))
+
+        return sorted((result for result in results
+                       if not any(dominates(other, result) for other in results)),
+                      key=lambda result: result["evaluations"])
+
+    @staticmethod
+    def select(pareto_front: list[dict], target_error: float) -> dict:
+        """
+        Select the cheapest setting of a Pareto front that reaches a target error.
+
+        Parameters
+        ----------
+        pareto_front: list[dict]
+            The Pareto-optimal settings as returned by get_pareto_front.
+        target_error: float
+            The maximal acceptable average error.
+
+        Returns
+        -------
+        dict
+            The parameters of the setting with the fewest evaluations reaching the
+            target error, or of the most accurate setting if none reaches it.
+
+        """
+        accurate: list[dict] = [
+            result for result in pareto_front if result["error"] <= target_error]
+        chosen: dict = (min(accurate, key=lambda result: result["evaluations"])
+                        if accurate else
+                        min(pareto_front, key=lambda result: result["error"]))
+
+        return chosen["parameters"]
+
+    def create_profile(self, target_error: float = 0.01,
+                       processes: int | None = None) -> dict:
+        """
+        Tune all methods and create the profile entry of the function.
+
+        Parameters
+        ----------
+        target_error: float
+            The maximal acceptable average error.
+        processes: int | None
+            Number of worker processes. Defaults to the number of CPUs.
+
+        Returns
+        -------
+        dict
+            The selected parameters and the Pareto front of every method.
+
+        """
+        profile: dict = {}
+
+        for method in ParameterTuner.GRIDS:
+            pareto_front: list[dict] = ParameterTuner.get_pareto_front(
+                self.tune(method, processes))
+            profile[method] = {
+                "selected": ParameterTuner.select(pareto_front, target_error),
+                "pareto": pareto_front}
+
+        return profile
+
+    @staticmethod
+    def measure(job: tuple) -> dict:
+        """
+        Measure one setting from all starting points.
+
+        Parameters
+        ----------
+        job: tuple
+            The function, the method, the parameters of the setting, the starting
+            points and the reference points.
+
+        Returns
+        -------
+        dict
+            The parameters and the average evaluations, seconds and error.
+
+        """
+        function, method, parameters, starting_points, references = job
+        points, evaluations, seconds = ParameterTuner.__run(
+            function, method, parameters, starting_points)
+
+        # Average the distance to the reference points, failed runs count infinite
+        error: float = sum(
+            ((point.get_x_value() - reference.get_x_value()) ** 2 +
+             (point.get_y_value() - reference.get_y_value()) ** 2) ** .5
+            if point is not None and reference is not None else float("inf")
+            for point, reference in zip(points, references)) / len(starting_points)
+
+        return {"parameters": parameters,
+                "evaluations": evaluations / len(starting_points),
+                "seconds": seconds / len(starting_points), "error": error}
+
+    @staticmethod
+    def __run(function: Function, method: str, parameters: dict,
+              starting_points: list[Point]) -> tuple[list[Point | None], int, float]:
+        """
+        Execute a method with one setting from all starting points.
+
+        Parameters
+        ----------
+        function: Function
+            The function whose minima are searched.
+        method: str
+            Either 'gradient_descend' or 'edge_search'.
+        parameters: dict
+            The parameters of the method.
+        starting_points: list[Point]
+            Points from which the method starts.
+
+        Returns
+        -------
+        tuple[list[Point | None], int, float]
+            The determined points (None if a run failed), the total number of
+            evaluations and the total wall time in seconds.
+
+        """
+        counting: CountingFunction = CountingFunction(function)
+        points: list[Point | None] = []
+        start: float = time.perf_counter()
+
+        for starting_point in starting_points:
+            try:
+                if method == "edge_search":
+                    points.append(counting.edge_search(
+                        starting_point, parameters["distance"],
+                        int(parameters["number_of_steps"])))
+                else:
+                    points.append(counting.gradient_descend(
+                        starting_point, parameters["distance"], parameters["factor"]))
+            except ZeroDivisionError:
+                # The gradient descend can not normalize a vanishing gradient
+                points.append(None)
+
+        return (points, counting.get_evaluation_count() + counting.get_gradient_count(),
+                time.perf_counter() - start)
@@ -0,0 +1,483 @@
+"""File containing the class Rasterizer."""
+
+# Import used Python libraries
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from math import isfinite
+from multiprocessing import Pool
+
+# Import used classes
+from classes.function import Function
+
+class Rasterizer:
+    """
+    Class rasterizing the values of a function over its intervals.
+
+    The raster is evaluated in square tiles via the batch evaluation path of the
+    function, optionally in multiple processes. Each finished tile is streamed into a
+    memory-mapped file of native float32 values (row by row, the first row belonging
+    to the upper Y border). The indices of finished tiles are stored in a progress
+    file next to the raster, so an interrupted rasterization can be resumed.
+
+    Attributes
+    ----------
+    function: Function
+        The rasterized function.
+    width: int
+        Number of pixels in X direction.
+    height: int
+        Number of pixels in Y direction.
+    tile_size: int
+        Number of pixels per side of one tile.
+
+    Methods
+    -------
+    set_function
+        Set the rasterized function.
+    get_function
+        Return the rasterized function.
+    set_size
+        Set the number of pixels of the raster.
+    get_width
+        Return the number of pixels in X direction.
+    get_height
+        Return the number of pixels in Y direction.
+    set_tile_size
+        Set the number of pixels per side of one tile.
+    get_tile_size
+        Return the number of pixels per side of one tile.
+    get_tiles
+        Return the pixel rectangles of all tiles.
+    get_tile_area
+        Convert the pixel rectangle of a tile into coordinates of the function.
+    rasterize
+        Rasterize the function into a memory-mapped file.
+    rasterize_tile
+        Calculate the values of a function for one tile.
+    write_image
+        Write a rasterized file as grayscale PGM or PNG image.
+
+    """
+
+    # Number of finished tiles after which the raster and the progress are saved
+    CHECKPOINT_TILES: int = 16
+
+    def __init__(self, function: Function, width: int, height: int,
+                 tile_size: int = 256) -> None:
+        """
+        Construct one rasterizer with the given parameters.
+
+        Parameters
+        ----------
+        function: Function
+            The rasterized function.
+        width: int
+            Number of pixels in X direction.
+        height: int
+            Number of pixels in Y direction.
+        tile_size: int
+            Number of pixels per side of one tile.
+
+        """
+        self.set_function(function)
+        self.set_size(width, height)
+        self.set_tile_size(tile_size)
+
+    def set_function(self, function: Function) -> None:
+        """
+        Set the rasterized function.
+
+        Parameters
+        ----------
+        function: Function
+            The rasterized function.
+
+        """
+        self.__function: Function = function
+
+    def get_function(self) -> Function:
+        """
+        Return the rasterized function.
+
+        Returns
+        -------
+        function: Function
+            The rasterized function.
+
+        """
+        return self.__function
+
+    def set_size(self, width: int, height: int) -> None:
+        """
+        Set the number of pixels of the raster.
+
+        Parameters
+        ----------
+        width: int
+            Number of pixels in X direction.
+        height: int
+            Number of pixels in Y direction.
+
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("The raster needs at least one pixel in each direction")
+
+        self.__width: int = width
+        self.__height: int = height
+
+    def get_width(self) -> int:
+        """
+        Return the number of pixels in X direction.
+
+        Returns
+        -------
+        width: int
+            Number of pixels in X direction.
+
+        """
+        return self.__width
+
+    def get_height(self) -> int:
+        """
+        Return the number of pixels in Y direction.
+
+        Returns
+        -------
+        height: int
+            Number of pixels in Y direction.
+
+        """
+        return self.__height
+
+    def set_tile_size(self, tile_size: int) -> None:
+        """
+        Set the number of pixels per side of one tile.
+
+        Parameters
+        ----------
+        tile_size: int
+            Number of pixels per side of one tile.
+
+        """
+        if tile_size <= 0:
+            raise ValueError("The tile size needs to be positive")
+
+        self.__tile_size: int = tile_size
+
+    def get_tile_size(self) -> int:
+        """
+        Return the number of pixels per side of one tile.
+
+        Returns
+        -------
+        tile_size: int
+            Number of pixels per side of one tile.
+
+        """
+        return self.__tile_size
+
+    def get_tiles(self) -> list[tuple[int, int, int, int]]:
+        """
+        Return the pixel rectangles of all tiles.
+
+        Returns
+        -------
+        list[tuple[int, int, int, int]]
+            First column, first row, number of columns and number of rows of every
+            tile. The index of a tile in this list is its index in the progress file.
+
+        """
+        size: int = self.get_tile_size()
+
+        return [(column, row, min(size, self.get_width() - column),
+                 min(size, self.get_height() - row))
+                for row in range(0, self.get_height(), size)
+                for column in range(0, self.get_width(), size)]
+
+    def rasterize(self, path: str, processes: int | None = None) -> None:
+        """
+        Rasterize the function into a memory-mapped file.
+
+        Tiles listed in the progress file '<path>.tiles' are skipped, so calling this
+        method again after an interruption resumes the rasterization. A progress file
+        of a raster with another width, height or tile size is discarded.
+
+        Parameters
+        ----------
+        path: str
+            Path of the raster file.
+        processes: int | None
+            Number of worker processes. Defaults to the number of CPUs, a value of 1
+            evaluates all tiles in the current process.
+
+        """
+        size: int = self.get_width() * self.get_height() * 4
+        tiles: list[tuple[int, int, int, int]] = self.get_tiles()
+
+        # Read the indices of the tiles that are already finished
+        done: set[int] = self.__read_progress(path)
+
+        # Create the raster file or reuse the one of an interrupted rasterization
+        with open(path, "ab") as raster:
+            if raster.tell() != size:
+                raster.truncate(size)
+
+        jobs: list[tuple] = [
+            (self.get_function(), index, self.get_tile_area(tile))
+            for index, tile in enumerate(tiles) if index not in done]
+
+        with open(path, "r+b") as raster, \
+                mmap.mmap(raster.fileno(), size) as memory, \
+                open(path + ".tiles", "a", encoding="utf-8") as progress:
+            if processes == 1:
+                self.__store_tiles(
+                    map(Rasterizer.rasterize_tile, jobs), tiles, memory, progress)
+            else:
+                with Pool(processes) as pool:
+                    self.__store_tiles(
+                        pool.imap_unordered(Rasterizer.rasterize_tile, jobs),
+                        tiles, memory, progress)
+
+    @staticmethod
+    def rasterize_tile(
+            job: tuple[Function, int, tuple[float, float, float, float, int, int]]
+    ) -> tuple[int, bytes]:
+        """
+        Calculate the values of a function for one tile.
+
+        Parameters
+        ----------
+        job: tuple[Function, int, tuple[float, float, float, float, int, int]]
+            The function, the index of the tile and the area of the tile. The area
+            consists of the X value of the first column, the Y value of the first row,
+            the X step, the Y step, the number of columns and the number of rows.
+
+        Returns
+        -------
+        tuple[int, bytes]
+            Index of the tile and its values as native float32 bytes, row by row.
+
+        """
+        function, index, (x_start, y_start, x_step, y_step, columns, rows) = job
+
+        # Determine the coordinates of all pixels of the tile
+        x_values: list[float] = [x_start + column * x_step
+                                 for _ in range(rows) for column in range(columns)]
+        y_values: list[float] = [y_start - row * y_step
+                                 for row in range(rows) for _ in range(columns)]
+
+        return index, array("f", function.get_values(x_values, y_values)).tobytes()
+
+    def write_image(self, path: str, image_path: str) -> None:
+        """
+        Write a rasterized file as grayscale PGM or PNG image.
+
+        The finite values are scaled linearly between their minimum (black) and
+        their maximum (white). Positive infinity is drawn white, negative infinity
+        and NaN black. The format is chosen by the extension of the image path.
+
+        Parameters
+        ----------
+        path: str
+            Path of the raster file.
+        image_path: str
+            Path of the image file, ending with '.pgm' or '.png'.
+
+        """
+        # Determine the range of the finite values
+        minimum: float = float("inf")
+        maximum: float = float("-inf")
+        for values in self.__read_rows(path):
+            finite: list[float] = [value for value in values if isfinite(value)]
+            minimum = min([minimum] + finite)
+            maximum = max([maximum] + finite)
+        scale: float = 255 / (maximum - minimum) if maximum > minimum else 0.0
+
+        # Convert every row into bytes of grey values, infinity is white, NaN black
+        rows = (bytes(int((value - minimum) * scale) if isfinite(value)
+                      else 255 if value > 0 else 0 for value in values)
+                for values in self.__read_rows(path))
+
+        if image_path.lower().endswith(".png"):
+            self.__write_png(image_path, rows)
+        else:
+            with open(image_path, "wb") as image:
+                image.write(f"P5\n{self.get_width()} {self.get_height()}\n255\n"
+                            .encode("ascii"))
+                for row in rows:
+                    image.write(row)
+
+    def get_tile_area(self, tile: tuple[int, int, int, int]
+                        ) -> tuple[float, float, float, float, int, int]:
+        """
+        Convert the pixel rectangle of a tile into coordinates of the function.
+
+        Parameters
+        ----------
+        tile: tuple[int, int, int, int]
+            First column, first row, number of columns and number of rows.
+
+        Returns
+        -------
+        tuple[float, float, float, float, int, int]
+            X value of the first column, Y value of the first row, X step, Y step,
+            number of columns and number of rows.
+
+        """
+        lower, upper = self.get_function().get_intervals()
+        x_step: float = (upper.get_x_value() - lower.get_x_value()) / self.get_width()
+        y_step: float = (upper.get_y_value() - lower.get_y_value()) / self.get_height()
+
+        # Pixel values are taken at the center of each pixel
+        return (lower.get_x_value() + (tile[0] + 0.5) * x_step,
+                upper.get_y_value() - (tile[1] + 0.5) * y_step,
+                x_step, y_step, tile[2], tile[3])
+
+    def __read_progress(self, path: str) -> set[int]:
+        """
+        Read the finished tiles of an interrupted rasterization of the same raster.
+
+        The first line of the progress file holds the width, the height and the tile
+        size of the raster. If the file is missing or was written for a different
+        raster, or if the raster file is missing or does not hold a value for every
+        pixel, the rasterization starts over with a fresh progress file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the raster file.
+
+        Returns
+        -------
+        set[int]
+            Indices of the tiles that are already finished.
+
+        """
+        header: str = f"{self.get_width()} {self.get_height()} {self.get_tile_size()}"
+
+        # Only trust the progress file if the raster file holds every pixel
+        size: int = self.get_width() * self.get_height() * 4
+        if (os.path.exists(path + ".tiles") and os.path.exists(path) and
+                os.path.getsize(path) == size):
+            with open(path + ".tiles", encoding="utf-8") as progress:
+                lines: list[str] = [line.strip() for line in progress if line.strip()]
+            if lines and lines[0] == header:
+                return {int(line) for line in lines[1:]}
+
+        # Start over with an empty raster and a progress file of this raster
+        with open(path, "wb"):
+            pass
+        with open(path + ".tiles", "w", encoding="utf-8") as progress:
+            progress.write(header + "\n")
+
+        return set()
+
+    def __store_tiles(self, results, tiles: list[tuple[int, int, int, int]],
+                      memory: mmap.mmap, progress) -> None:
+        """
+        Copy finished tiles into the raster and record them in the progress file.
+
+        Parameters
+        ----------
+        results
+            Iterable of tile indices and their values as returned by rasterize_tile.
+        tiles: list[tuple[int, int, int, int]]
+            The pixel rectangles of all tiles.
+        memory: mmap.mmap
+            The memory-mapped raster file.
+        progress
+            The opened progress file.
+
+        """
+        pending: list[int] = []
+
+        for index, values in results:
+            column, row, columns, rows = tiles[index]
+
+            # Copy the tile row by row into the raster
+            for offset in range(rows):
+                start: int = ((row + offset) * self.get_width() + column) * 4
+                memory[start:start + columns * 4] = \
+                    values[offset * columns * 4:(offset + 1) * columns * 4]
+            pending.append(index)
+
+            # Save the raster before recording the finished tiles
+            if len(pending) >= Rasterizer.CHECKPOINT_TILES:
+                Rasterizer.__save_progress(memory, progress, pending)
+
+        Rasterizer.__save_progress(memory, progress, pending)
+
+    @staticmethod
+    def __save_progress(memory: mmap.mmap, progress, pending: list[int]) -> None:
+        """
+        Flush the raster and append the finished tiles to the progress file.
+
+        Parameters
+        ----------
+        memory: mmap.mmap
+            The memory-mapped raster file.
+        progress
+            The opened progress file.
+        pending: list[int]
+            Indices of the finished tiles, emptied afterwards.
+
+        """
+        memory.flush()
+        progress.writelines(f"{index}\n" for index in pending)
+        progress.flush()
+        pending.clear()
+
+    def __read_rows(self, path: str):
+        """
+        Read a raster file row by row.
+
+        Parameters
+        ----------
+        path: str
+            Path of the raster file.
+
+        Yields
+        ------
+        array
+            Values of one row.
+
+        """
+        with open(path, "rb") as raster:
+            for _ in range(self.get_height()):
+                values: array = array("f")
+                values.frombytes(raster.read(self.get_width() * 4))
+                yield values
+
+    def __write_png(self, image_path: str, rows) -> None:
+        """
+        Write rows of grey values as 8 bit grayscale PNG image.
+
+        Parameters
+        ----------
+        image_path: str
+            Path of the image file.
+        rows
+            Iterable of the grey values of every row.
+
+        """
+        def write_chunk(image, kind: bytes, data: bytes) -> None:
+            image.write(struct.pack(">I", len(data)) + kind + data +
+                        struct.pack(">I", zlib.crc32(kind + data)))
+
+        compressor = zlib.compressobj()
+
+        with open(image_path, "wb") as image:
+            image.write(b"\x89PNG\r\n\x1a\n")
+            write_chunk(image, b"IHDR", struct.pack(
+                ">IIBBBBB", self.get_width(), self.get_height(), 8, 0, 0, 0, 0))
+
+            # Compress the rows one by one, each with the filter type 0
+            for row in rows:
+                data: bytes = compressor.compress(b"\x00" + row)
+                if data:
+                    write_chunk(image, b"IDAT", data)
+            write_chunk(image, b"IDAT", compressor.flush())
+            write_chunk(image, b"IEND", b"")
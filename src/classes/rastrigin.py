@@ -0,0 +1,90 @@
+"""File containing the class for the Rastrigin benchmark function."""
+
+# Import trigonometric functions
+from math import cos, pi, sin
+
+# Import used classes
+from classes.benchmark_function import BenchmarkFunction
+from classes.vector import Vector
+from classes.point import Point
+
+class Rastrigin(BenchmarkFunction):
+    """
+    Rastrigin benchmark function.
+
+    The function is defined as follows:
+    20 + x^2 - 10 * cos(2 * pi * x) + y^2 - 10 * cos(2 * pi * y)
+
+    Methods
+    -------
+    get_value
+        Calculate the value of a two dimensional function at a point.
+    get_values
+        Calculate the values of the function at multiple points.
+    get_gradient
+        Get the value of the gradient at a specified point.
+
+    """
+
+    INTERVALS: list[Point] = [Point(-5.12, -5.12), Point(5.12, 5.12)]
+    KNOWN_MINIMA: list[Point] = [Point(0.0, 0.0)]
+
+    def get_value(self, x_value: float, y_value: float) -> float:
+        """
+        Calculate the value of a two dimensional function at a point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        float
+            Value of the function at the specified point.
+
+        """
+        return (20 + x_value ** 2 - 10 * cos(2 * pi * x_value) +
+                y_value ** 2 - 10 * cos(2 * pi * y_value))
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the function at multiple points.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the function at the specified points.
+
+        """
+        return [20 + x * x - 10 * cos(2 * pi * x) + y * y - 10 * cos(2 * pi * y)
+                for x, y in zip(x_values, y_values)]
+
+    def get_gradient(self, x_value: float, y_value: float) -> Vector:
+        """
+        Get the value of the gradient at a specified point.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        Vector
+            Values of the gradient at the specified point.
+
+        """
+        return Vector(2 * x_value + 20 * pi * sin(2 * pi * x_value),
+                      2 * y_value + 20 * pi * sin(2 * pi * y_value))
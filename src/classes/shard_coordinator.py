@@ -0,0 +1,265 @@
+"""File containing the class ShardCoordinator."""
+
+# Import used Python libraries
+import json
+import socket
+import time
+from collections import deque
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Iterator
+
+class ShardCoordinator:
+    """
+    Coordinator distributing a batch of shards to ShardWorkers over TCP.
+
+    Every worker is driven by a thread of its own that sends one shard at a time.
+    Idle workers take the next pending shard, and once no shard is pending they
+    steal a copy of the oldest shard still running on another worker, so slow
+    workers do not hold up the batch. The first result of a shard wins. A worker
+    that misses its heartbeats or loses the connection has its shard put back into
+    the queue, and it is dropped after repeated failures.
+
+    Attributes
+    ----------
+    workers: list[tuple[str, int]]
+        Addresses of all workers.
+    heartbeat_timeout: float
+        Seconds without any message after which a worker is considered failed.
+    retries: int
+        Number of consecutive failures after which a worker is dropped.
+
+    Methods
+    -------
+    get_workers
+        Return the addresses of all workers.
+    run
+        Execute a batch of shards and yield their results as they arrive.
+
+    """
+
+    def __init__(self, workers: list[tuple[str, int]], heartbeat_timeout: float = 5.0,
+                 retries: int = 3) -> None:
+        """
+        Construct one coordinator with the given parameters.
+
+        Parameters
+        ----------
+        workers: list[tuple[str, int]]
+            Addresses of all workers.
+        heartbeat_timeout: float
+            Seconds without any message after which a worker is considered failed.
+        retries: int
+            Number of consecutive failures after which a worker is dropped.
+
+        """
+        self.__workers: list[tuple[str, int]] = workers
+        self.__heartbeat_timeout: float = heartbeat_timeout
+        self.__retries: int = retries
+        self.__lock: Lock = Lock()
+        self.__pending: deque[int] = deque()
+        self.__running: dict[int, int] = {}
+        self.__finished: set[int] = set()
+
+    def get_workers(self) -> list[tuple[str, int]]:
+        """
+        Return the addresses of all workers.
+
+        Returns
+        -------
+        workers: list[tuple[str, int]]
+            Addresses of all workers.
+
+        """
+        return self.__workers
+
+    def run(self, jobs: list[dict]) -> Iterator[tuple[int, dict]]:
+        """
+        Execute a batch of shards and yield their results as they arrive.
+
+        Parameters
+        ----------
+        jobs: list[dict]
+            Payloads of all shards as accepted by ShardWorker.
+
+        Yields
+        ------
+        tuple[int, dict]
+            Index of the shard in the batch and its result. Shards that failed on
+            the worker yield a dictionary with the key 'error'.
+
+        Raises
+        ------
+        RuntimeError
+            If all workers have been dropped before the batch was finished.
+
+        """
+        with self.__lock:
+            self.__pending = deque(range(len(jobs)))
+            self.__running = {}
+            self.__finished = set()
+
+        # Queue through which the threads of the workers hand in the results
+        results: Queue = Queue()
+
+        threads: list[Thread] = [
+            Thread(target=self.__drive, args=(address, jobs, results), daemon=True)
+            for address in self.get_workers()]
+        for thread in threads:
+            thread.start()
+
+        # Gather the results of all workers into one stream
+        for _ in range(len(jobs)):
+            while True:
+                try:
+                    yield results.get(timeout=self.__heartbeat_timeout)
+                    break
+                except Empty as error:
+                    if not any(thread.is_alive() for thread in threads):
+                        raise RuntimeError("All workers have failed") from error
+
+    def __next_job(self, total: int) -> int | None:
+        """
+        Take the next pending shard or steal the oldest running one.
+
+        Only shards that run on a single worker are stolen.
+
+        Parameters
+        ----------
+        total: int
+            Number of shards in the batch.
+
+        Returns
+        -------
+        int | None
+            Index of the shard or None if the batch is finished.
+
+        """
+        while True:
+            with self.__lock:
+                if len(self.__finished) == total:
+                    return None
+                while self.__pending:
+                    job: int = self.__pending.popleft()
+                    if job not in self.__finished:
+                        self.__running[job] = self.__running.get(job, 0) + 1
+                        return job
+
+                # Steal the oldest shard that runs on a single worker
+                for job, copies in self.__running.items():
+                    if copies == 1:
+                        self.__running[job] += 1
+                        return job
+
+            time.sleep(0.05)
+
+    def __finish(self, job: int, result: dict | None, results: Queue) -> None:
+        """
+        Record the result of a shard or put it back into the queue.
+
+        Parameters
+        ----------
+        job: int
+            Index of the shard.
+        result: dict | None
+            Result of the shard or None if its worker failed.
+        results: Queue
+            Queue of the finished shards and their results.
+
+        """
+        with self.__lock:
+            if job in self.__finished:
+                return
+            self.__running[job] -= 1
+            if result is not None:
+                self.__finished.add(job)
+                del self.__running[job]
+                results.put((job, result))
+            elif self.__running[job] == 0:
+                del self.__running[job]
+                self.__pending.appendleft(job)
+
+    def __drive(self, address: tuple[str, int], jobs: list[dict],
+                results: Queue) -> None:
+        """
+        Send shards to one worker until the batch is finished or it has failed.
+
+        Parameters
+        ----------
+        address: tuple[str, int]
+            Address of the worker.
+        jobs: list[dict]
+            Payloads of all shards.
+        results: Queue
+            Queue of the finished shards and their results.
+
+        """
+        failures: int = 0
+        connection: socket.socket | None = None
+        reader = None
+
+        while failures < self.__retries:
+            job: int | None = self.__next_job(len(jobs))
+            if job is None:
+                break
+            try:
+                if connection is None:
+                    connection = socket.create_connection(
+                        address, timeout=self.__heartbeat_timeout)
+                    reader = connection.makefile("rb")
+                result: dict = ShardCoordinator.__execute(
+                    connection, reader, job, jobs[job])
+                failures = 0
+            except (OSError, ValueError):
+                # Give the shard back and reconnect for the next one
+                self.__finish(job, None, results)
+                if connection is not None:
+                    connection.close()
+                connection = None
+                failures += 1
+                time.sleep(0.1 * failures)
+                continue
+            self.__finish(job, result, results)
+
+        if connection is not None:
+            connection.close()
+
+    @staticmethod
+    def __execute(connection: socket.socket, reader, job: int, payload: dict) -> dict:
+        """
+        Send one shard to a worker and wait for its result.
+
+        Parameters
+        ----------
+        connection: socket.socket
+            Connection to the worker. Its timeout is the heartbeat timeout.
+        reader
+            Binary file reading the messages of the connection.
+        job: int
+            Index of the shard.
+        payload: dict
+            Payload of the shard.
+
+        Returns
+        -------
+        dict
+            Result of the shard.
+
+        Raises
+        ------
+        ValueError
+            If the worker closed the connection or sent an unexpected message.
+
+        """
+        connection.sendall(json.dumps(
+            {"type": "job", "job": job, "payload": payload}).encode("utf-8") + b"\n")
+
+        # Every message, including heartbeats, resets the timeout of the socket
+        for line in reader:
+            message: dict = json.loads(line)
+            if message.get("type") == "result" and message.get("job") == job:
+                return message["result"]
+            if message.get("type") == "error" and message.get("job") == job:
+                return {"error": message.get("error")}
+
+        raise ValueError("The worker closed the connection")
@@ -0,0 +1,190 @@
+"""File containing the class ShardWorker."""
+
+# Import used Python libraries
+import base64
+import json
+from socketserver import StreamRequestHandler, TCPServer
+from threading import Event, Lock, Thread
+
+# Import used classes
+from classes.optimization_service import OptimizationService
+from classes.point import Point
+from classes.rasterizer import Rasterizer
+
+class ShardWorker:
+    """
+    Worker executing the shards sent by a ShardCoordinator over TCP.
+
+    Messages are JSON objects, one per line. The coordinator sends
+    {"type": "job", "job": <id>, "payload": {...}} and the worker answers with
+    {"type": "result", "job": <id>, "result": {...}}. While a shard is executed the
+    worker sends {"type": "heartbeat"} in regular intervals. The payload is either an
+    optimization request as accepted by OptimizationService or a raster tile:
+    {"method": "tile", "function": 2, "width": 1024, "height": 1024,
+    "tile_size": 256, "index": 3}
+
+    Attributes
+    ----------
+    intervals: dict[int, list[Point]]
+        Intervals of all functions the worker can optimize.
+    heartbeat_interval: float
+        Seconds between two heartbeats.
+
+    Methods
+    -------
+    get_intervals
+        Return the intervals of all functions the worker can optimize.
+    execute
+        Execute one shard.
+    serve
+        Listen for a coordinator until the worker is interrupted.
+    run_job
+        Execute one shard while sending heartbeats and send its result.
+
+    """
+
+    def __init__(self, intervals: dict[int, list[Point]],
+                 heartbeat_interval: float = 1.0) -> None:
+        """
+        Construct one worker with the given parameters and build its functions.
+
+        Parameters
+        ----------
+        intervals: dict[int, list[Point]]
+            Intervals of all functions the worker can optimize.
+        heartbeat_interval: float
+            Seconds between two heartbeats.
+
+        """
+        self.__intervals: dict[int, list[Point]] = intervals
+        self.__heartbeat_interval: float = heartbeat_interval
+        OptimizationService.initialize_worker(intervals)
+
+    def get_intervals(self) -> dict[int, list[Point]]:
+        """
+        Return the intervals of all functions the worker can optimize.
+
+        Returns
+        -------
+        intervals: dict[int, list[Point]]
+            Intervals of all functions the worker can optimize.
+
+        """
+        return self.__intervals
+
+    def execute(self, payload: dict) -> dict:
+        """
+        Execute one shard.
+
+        Parameters
+        ----------
+        payload: dict
+            Optimization request or raster tile.
+
+        Returns
+        -------
+        dict
+            The found minimum and its value, or the index and the base64 encoded
+            float32 values of the tile.
+
+        Raises
+        ------
+        ValueError
+            If the payload is not a valid optimization request or tile.
+
+        """
+        if payload.get("method") != "tile":
+            # Reject requests that would never finish, like the HTTP service does
+            error: str | None = OptimizationService.validate(
+                payload, self.get_intervals())
+            if error is not None:
+                raise ValueError(error)
+            return OptimizationService.solve(payload)
+
+        rasterizer: Rasterizer = Rasterizer(
+            OptimizationService.worker_functions[payload["function"]].get_function(),
+            payload["width"], payload["height"], payload.get("tile_size", 256))
+        tiles: list[tuple[int, int, int, int]] = rasterizer.get_tiles()
+        if (isinstance(payload["index"], bool) or
+                not isinstance(payload["index"], int) or
+                not 0 <= payload["index"] < len(tiles)):
+            raise ValueError(f"The tile index needs to be below {len(tiles)}")
+        tile: tuple[int, int, int, int] = tiles[payload["index"]]
+        _, values = Rasterizer.rasterize_tile(
+            (rasterizer.get_function(), payload["index"],
+             rasterizer.get_tile_area(tile)))
+
+        return {"index": payload["index"],
+                "values": base64.b64encode(values).decode("ascii")}
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9000) -> None:
+        """
+        Listen for a coordinator until the worker is interrupted.
+
+        Parameters
+        ----------
+        host: str
+            Host the worker listens on.
+        port: int
+            Port the worker listens on.
+
+        """
+        worker: ShardWorker = self
+
+        class Handler(StreamRequestHandler):
+            """Handler executing the shards of one coordinator connection."""
+
+            def handle(self) -> None:
+                """Execute shards until the coordinator closes the connection."""
+                lock: Lock = Lock()
+
+                def send(message: dict) -> None:
+                    with lock:
+                        self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+                        self.wfile.flush()
+
+                for line in self.rfile:
+                    message: dict = json.loads(line)
+                    if message.get("type") == "job":
+                        worker.run_job(message, send)
+
+        class Server(TCPServer):
+            """Server that can be restarted on the port of a stopped worker."""
+
+            allow_reuse_address = True
+
+        with Server((host, port), Handler) as server:
+            server.serve_forever()
+
+    def run_job(self, message: dict, send) -> None:
+        """
+        Execute one shard while sending heartbeats and send its result.
+
+        Parameters
+        ----------
+        message: dict
+            The job message sent by the coordinator.
+        send
+            Callable sending one message to the coordinator.
+
+        """
+        finished: Event = Event()
+
+        def beat() -> None:
+            while not finished.wait(self.__heartbeat_interval):
+                send({"type": "heartbeat"})
+
+        heartbeat: Thread = Thread(target=beat, daemon=True)
+        heartbeat.start()
+        try:
+            answer: dict = {"type": "result", "job": message["job"],
+                            "result": self.execute(message["payload"])}
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            # Report every failure of the shard, so the coordinator does not retry it
+            answer = {"type": "error", "job": message["job"],
+                      "error": f"{type(error).__name__}: {error}"}
+        finally:
+            finished.set()
+            heartbeat.join()
+
+        send(answer)
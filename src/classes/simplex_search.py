@@ -0,0 +1,263 @@
+"""File containing the class SimplexSearch."""
+
+# Import used classes
+from classes.function import Function
+from classes.point import Point
+from classes.vector import Vector
+
+class SimplexSearch:
+    """
+    Class minimizing a function with the Nelder-Mead simplex method.
+
+    Attributes
+    ----------
+    function: Function
+        The minimized function.
+
+    Methods
+    -------
+    get_function
+        Return the minimized function.
+    nelder_mead_search
+        Use the Nelder-Mead simplex method to determine a minimum.
+
+    """
+
+    # Reflection, expansion, contraction and shrink coefficient of Nelder-Mead
+    NELDER_MEAD_COEFFICIENTS: tuple[float, float, float, float] = (1.0, 2.0, 0.5, 0.5)
+    # Maximal number of simplex transformations in one Nelder-Mead run
+    NELDER_MEAD_ITERATIONS: int = 1000
+
+    def __init__(self, function: Function) -> None:
+        """
+        Construct one simplex search for the given function.
+
+        Parameters
+        ----------
+        function: Function
+            The minimized function.
+
+        """
+        self.__function: Function = function
+
+    def get_function(self) -> Function:
+        """
+        Return the minimized function.
+
+        Returns
+        -------
+        function: Function
+            The minimized function.
+
+        """
+        return self.__function
+
+    def nelder_mead_search(
+            self, starting_point: Point, distance: float, restarts: int = 1,
+            use_batch: bool = False) -> Point:
+        """
+        Use the Nelder-Mead simplex method to determine a minimum.
+
+        The method is derivative-free and keeps the simplex within the intervals of
+        the function. It stops once all corners of the simplex are in range of its
+        best corner, all corners have the same value or NELDER_MEAD_ITERATIONS
+        transformations have been performed. Afterwards the method is restarted with
+        a fresh simplex around the determined point, until a restart does not move
+        the point further than the distance or the number of restarts is used up.
+
+        Parameters
+        ----------
+        starting_point: Point
+            Point from which the method starts.
+        distance: float
+            Distance in which all corners of the simplex need to be for the method to
+            stop.
+        restarts: int
+            Maximal number of restarts performed after the first run.
+        use_batch: bool
+            Boolean indicating whether the initial simplex and the shrink steps are
+            evaluated via get_values.
+
+        Returns
+        -------
+        determined_point: Point
+            Determined point of the minimum.
+
+        """
+        # Run the method once from the starting point
+        determined_point: Point = self.__nelder_mead_run(
+            starting_point, distance, use_batch)
+
+        # Restart the method until the determined point does not move anymore
+        for _ in range(restarts):
+            restarted_point: Point = self.__nelder_mead_run(
+                determined_point, distance, use_batch)
+
+            # Stop restarting if the restart stayed in range of the last point
+            if Point.points_are_in_range(determined_point, restarted_point, distance):
+                determined_point = restarted_point
+                break
+
+            # Continue from the point determined by the restart
+            determined_point = restarted_point
+
+        return determined_point
+
+    def __nelder_mead_run(self, starting_point: Point, distance: float,
+                          use_batch: bool) -> Point:
+        """
+        Perform one run of the Nelder-Mead simplex method.
+
+        Parameters
+        ----------
+        starting_point: Point
+            Point from which the run starts.
+        distance: float
+            Distance in which all corners of the simplex need to be for the run to
+            stop.
+        use_batch: bool
+            Boolean indicating whether the initial simplex and the shrink steps are
+            evaluated via get_values.
+
+        Returns
+        -------
+        Point
+            Best corner of the simplex.
+
+        """
+        # Size the initial simplex relative to the interval of the function
+        intervals: list[Point] = self.get_function().get_intervals()
+        step_x: float = 0.05 * abs(intervals[1].get_x_value() -
+                                   intervals[0].get_x_value())
+        step_y: float = 0.05 * abs(intervals[1].get_y_value() -
+                                   intervals[0].get_y_value())
+
+        # Step away from the nearer border so that the initial simplex is not flat
+        starting_point = self.get_function().clamp_point(starting_point)
+        upper: Point = self.get_function().clamp_point(
+            Point(float("inf"), float("inf")))
+        if starting_point.get_x_value() + (step_x or distance) > upper.get_x_value():
+            step_x = -step_x
+        if starting_point.get_y_value() + (step_y or distance) > upper.get_y_value():
+            step_y = -step_y
+
+        # Build and evaluate the initial simplex
+        simplex: list[Point] = [
+            starting_point,
+            starting_point.apply_vector(Vector(step_x or distance, 0), 1),
+            starting_point.apply_vector(Vector(0, step_y or distance), 1)]
+        values: list[float] = self.get_function().evaluate_points(simplex, use_batch)
+
+        # Transform the simplex until all corners are in range of the best corner
+        for _ in range(SimplexSearch.NELDER_MEAD_ITERATIONS):
+            # Sort the corners from the best to the worst
+            order: list[int] = sorted(range(3), key=values.__getitem__)
+            simplex = [simplex[i] for i in order]
+            values = [values[i] for i in order]
+
+            # Break the loop if all corners are in range of the best corner
+            if all(Point.points_are_in_range(simplex[0], corner, distance)
+                   for corner in simplex[1:]):
+                break
+
+            # Break the loop on a plateau, where no corner can be told apart
+            if values[2] - values[0] <= 0:
+                break
+
+            simplex, values = self.__nelder_mead_step(simplex, values, use_batch)
+
+        return simplex[min(range(3), key=values.__getitem__)]
+
+    def __nelder_mead_step(
+            self, simplex: list[Point], values: list[float],
+            use_batch: bool) -> tuple[list[Point], list[float]]:
+        """
+        Perform one transformation of a sorted simplex.
+
+        Parameters
+        ----------
+        simplex: list[Point]
+            Corners of the simplex sorted from the best to the worst.
+        values: list[float]
+            Values of the function at the corners of the simplex.
+        use_batch: bool
+            Boolean indicating whether the shrink step is evaluated via get_values.
+
+        Returns
+        -------
+        tuple[list[Point], list[float]]
+            The transformed simplex and the values at its corners.
+
+        """
+        reflection, expansion, contraction, _ = SimplexSearch.NELDER_MEAD_COEFFICIENTS
+
+        # Centroid of all corners except for the worst one
+        centroid: Point = Point(
+            (simplex[0].get_x_value() + simplex[1].get_x_value()) / 2,
+            (simplex[0].get_y_value() + simplex[1].get_y_value()) / 2)
+
+        # Direction from the worst corner through the centroid
+        direction: Vector = Vector(
+            centroid.get_x_value() - simplex[2].get_x_value(),
+            centroid.get_y_value() - simplex[2].get_y_value())
+
+        # Reflect the worst corner at the centroid
+        reflected: Point = self.get_function().clamp_point(
+            centroid.apply_vector(direction, reflection))
+        value_reflected: float = self.get_function().get_value(
+            reflected.get_x_value(), reflected.get_y_value())
+
+        # Expand the simplex if the reflected corner is the new best one
+        if value_reflected < values[0]:
+            expanded: Point = self.get_function().clamp_point(
+                centroid.apply_vector(direction, expansion))
+            value_expanded: float = self.get_function().get_value(
+                expanded.get_x_value(), expanded.get_y_value())
+            if value_expanded < value_reflected:
+                return simplex[:2] + [expanded], values[:2] + [value_expanded]
+            return simplex[:2] + [reflected], values[:2] + [value_reflected]
+
+        # Accept the reflected corner if it is better than the second worst one
+        if value_reflected < values[1]:
+            return simplex[:2] + [reflected], values[:2] + [value_reflected]
+
+        # Contract the simplex outside or inside depending on the reflected corner
+        contracted: Point = self.get_function().clamp_point(centroid.apply_vector(
+            direction, contraction * reflection if value_reflected < values[2]
+            else -contraction))
+        value_contracted: float = self.get_function().get_value(
+            contracted.get_x_value(), contracted.get_y_value())
+        if value_contracted <= min(value_reflected, values[2]):
+            return simplex[:2] + [contracted], values[:2] + [value_contracted]
+
+        return self.__nelder_mead_shrink(simplex, values, use_batch)
+
+    def __nelder_mead_shrink(
+            self, simplex: list[Point], values: list[float],
+            use_batch: bool) -> tuple[list[Point], list[float]]:
+        """
+        Shrink all corners of a sorted simplex towards its best corner.
+
+        Parameters
+        ----------
+        simplex: list[Point]
+            Corners of the simplex sorted from the best to the worst.
+        values: list[float]
+            Values of the function at the corners of the simplex.
+        use_batch: bool
+            Boolean indicating whether the shrunk corners are evaluated via
+            get_values.
+
+        Returns
+        -------
+        tuple[list[Point], list[float]]
+            The shrunk simplex and the values at its corners.
+
+        """
+        shrunk: list[Point] = [simplex[0].apply_vector(Vector(
+            corner.get_x_value() - simplex[0].get_x_value(),
+            corner.get_y_value() - simplex[0].get_y_value()),
+            SimplexSearch.NELDER_MEAD_COEFFICIENTS[3]) for corner in simplex[1:]]
+
+        return ([simplex[0]] + shrunk,
+                [values[0]] + self.get_function().evaluate_points(shrunk, use_batch))
@@ -0,0 +1,238 @@
+"""File containing the class StochasticSearch."""
+
+# Import used Python libraries
+from math import exp, inf, isfinite
+from random import Random
+
+# Import used classes
+from classes.function import Function
+from classes.point import Point
+from classes.simplex_search import SimplexSearch
+from classes.vector import Vector
+
+class StochasticSearch:
+    """
+    Class searching the global minimum of a function with randomized methods.
+
+    Attributes
+    ----------
+    function: Function
+        The minimized function.
+
+    Methods
+    -------
+    get_function
+        Return the minimized function.
+    basin_hopping
+        Use the basin-hopping method to determine a global minimum.
+    simulated_annealing
+        Use the simulated annealing method to determine a global minimum.
+
+    """
+
+    def __init__(self, function: Function) -> None:
+        """
+        Construct one stochastic search for the given function.
+
+        Parameters
+        ----------
+        function: Function
+            The minimized function.
+
+        """
+        self.__function: Function = function
+
+    def get_function(self) -> Function:
+        """
+        Return the minimized function.
+
+        Returns
+        -------
+        function: Function
+            The minimized function.
+
+        """
+        return self.__function
+
+    # The tuning parameters stay plain keyword arguments like those of the other methods
+    def basin_hopping(  # pylint: disable=too-many-arguments,too-many-locals
+            self, starting_point: Point, distance: float, factor: float,
+            step_size: float, number_of_hops: int, batch_size: int = 4,
+            patience: int = 5, seed: int | None = None) -> Point:
+        """
+        Use the basin-hopping method to determine a global minimum.
+
+        Each hop perturbs the current point several times and refines all perturbed
+        points in lockstep with the batched projected gradient descend method, so
+        that every step of the batch is evaluated with one call of get_values and
+        all refined points stay within the intervals of the function. The best
+        refined point replaces the current point if it has a lower finite value.
+        The method stops early once the best value has not improved for a number
+        of consecutive hops.
+
+        Parameters
+        ----------
+        starting_point: Point
+            Point from which the method starts.
+        distance: float
+            Distance used by the projected gradient descend method.
+        factor: float
+            Factor used by the projected gradient descend method.
+        step_size: float
+            Maximal distance on each axis by which a point is perturbed.
+        number_of_hops: int
+            Maximal number of hops the method shall perform.
+        batch_size: int
+            Number of perturbed points refined in every hop.
+        patience: int
+            Number of consecutive hops without improvement after which the method
+            stops.
+        seed: int | None
+            Seed of the random number generator to make the method reproducible.
+
+        Returns
+        -------
+        best_point: Point
+            Determined point of the global minimum.
+
+        """
+        function: Function = self.get_function()
+        random: Random = Random(seed)
+
+        # Refine the starting point to get the first basin
+        refined, values = function.batched_projected_gradient_descend(
+            [starting_point], distance, factor)
+        best_point, best_value = refined[0], values[0]
+
+        # Counter of consecutive hops without improvement
+        stalled: int = 0
+
+        # Hop between basins until the improvements have stopped
+        for _ in range(number_of_hops):
+            # Perturb the best point and refine all perturbed points in lockstep
+            refined, values = function.batched_projected_gradient_descend(
+                [self.__perturb_point(best_point, step_size, random)
+                 for _ in range(batch_size)], distance, factor)
+
+            # Ignore refined points without finite value
+            values = [value if isfinite(value) else inf for value in values]
+
+            # Determine the best refined point of the batch
+            index: int = min(range(batch_size), key=values.__getitem__)
+
+            # Accept the refined point if it improves the best value
+            if values[index] < best_value:
+                best_point, best_value = refined[index], values[index]
+                stalled = 0
+            else:
+                stalled += 1
+
+            # Break the loop if the improvements have stopped
+            if stalled >= patience:
+                break
+
+        return best_point
+
+    # Like for basin_hopping, the tuning parameters stay plain keyword arguments
+    def simulated_annealing(  # pylint: disable=too-many-arguments,too-many-locals
+            self, starting_point: Point, distance: float, step_size: float,
+            temperature: float, cooling: float = 0.9, batch_size: int = 8,
+            patience: int = 10, seed: int | None = None) -> Point:
+        """
+        Use the simulated annealing method to determine a global minimum.
+
+        In every iteration a batch of points around the current point is evaluated
+        and the best of them is accepted according to the Metropolis criterion.
+        Afterwards the temperature and the step size are reduced by the cooling
+        factor. The method stops once the step size falls below the distance or the
+        best value has not improved for a number of consecutive iterations. The best
+        visited point is finally refined with the Nelder-Mead simplex method.
+
+        Parameters
+        ----------
+        starting_point: Point
+            Point from which the method starts.
+        distance: float
+            Distance used to stop the method and by the Nelder-Mead simplex method.
+        step_size: float
+            Initial maximal distance on each axis by which a point is perturbed.
+        temperature: float
+            Initial temperature of the method.
+        cooling: float
+            Factor by which the temperature and the step size are reduced.
+        batch_size: int
+            Number of points evaluated in every iteration.
+        patience: int
+            Number of consecutive iterations without improvement after which the
+            method stops.
+        seed: int | None
+            Seed of the random number generator to make the method reproducible.
+
+        Returns
+        -------
+        Point
+            Determined point of the global minimum.
+
+        """
+        function: Function = self.get_function()
+        random: Random = Random(seed)
+
+        # Initialize the current and the best point as the starting point
+        current_point: Point = function.clamp_point(starting_point)
+        current_value: float = function.get_value(
+            current_point.get_x_value(), current_point.get_y_value())
+        best_point, best_value = current_point, current_value
+
+        # Counter of consecutive iterations without improvement
+        stalled: int = 0
+
+        # Cool down until the step size is too small or the improvements have stopped
+        while step_size >= distance and stalled < patience:
+            # Evaluate a batch of points around the current point
+            candidates: list[Point] = [
+                self.__perturb_point(current_point, step_size, random)
+                for _ in range(batch_size)]
+            values: list[float] = function.evaluate_points(candidates, True)
+            index: int = min(range(batch_size), key=values.__getitem__)
+
+            # Accept the best candidate according to the Metropolis criterion
+            if (values[index] < current_value or
+                    random.random() < exp((current_value - values[index]) /
+                                          temperature)):
+                current_point, current_value = candidates[index], values[index]
+
+            # Update the best visited point
+            if current_value < best_value:
+                best_point, best_value = current_point, current_value
+                stalled = 0
+            else:
+                stalled += 1
+
+            # Reduce the temperature and the step size
+            temperature *= cooling
+            step_size *= cooling
+
+        return SimplexSearch(function).nelder_mead_search(
+            best_point, distance, use_batch=True)
+
+    def __perturb_point(self, point: Point, step_size: float, random: Random) -> Point:
+        """
+        Move a point randomly while keeping it within the intervals of the function.
+
+        Parameters
+        ----------
+        point: Point
+            Point that shall be perturbed.
+        step_size: float
+            Maximal distance on each axis by which the point is moved.
+        random: Random
+            Random number generator used for the perturbation.
+
+        Returns
+        -------
+        Point
+            Perturbed point within the intervals of the function.
+
+        """
+        return self.get_function().clamp_point(point.apply_vector(
+            Vector(random.uniform(-1, 1), random.uniform(-1, 1)), step_size))
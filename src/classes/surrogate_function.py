@@ -0,0 +1,390 @@
+"""File containing the class SurrogateFunction."""
+
+# Import used Python libraries
+from math import cos, pi, sin
+
+# Import used classes
+from classes.counting_function import CountingFunction
+from classes.function import Function
+from classes.point import Point
+
+class SurrogateFunction(CountingFunction):
+    """
+    Function that wraps another function and minimizes it with a surrogate model.
+
+    All true evaluations of the wrapped function are stored in an archive. A local
+    quadratic model is fitted to the archived points around the current point and
+    its minimizer within a trust region proposes the next true evaluation.
+
+    Attributes
+    ----------
+    archive: dict[tuple[float, float], float]
+        All points evaluated by the wrapped function and their values.
+
+    Methods
+    -------
+    get_archive
+        Return all points evaluated by the wrapped function and their values.
+    get_value
+        Calculate the value of the wrapped function at a point.
+    get_values
+        Calculate the values of the wrapped function at multiple points.
+    surrogate_search
+        Use the surrogate model assisted trust region method to determine a minimum.
+
+    """
+
+    # Number of archived points the quadratic model is fitted to
+    MODEL_POINTS: int = 12
+    # Number of points on the border of the trust region the model is compared at
+    BORDER_POINTS: int = 64
+
+    def __init__(self, function: Function) -> None:
+        """
+        Construct one surrogate function wrapping the given function.
+
+        Parameters
+        ----------
+        function: Function
+            The wrapped function.
+
+        """
+        self.__archive: dict[tuple[float, float], float] = {}
+        super().__init__(function)
+
+    def get_archive(self) -> dict[tuple[float, float], float]:
+        """
+        Return all points evaluated by the wrapped function and their values.
+
+        Returns
+        -------
+        archive: dict[tuple[float, float], float]
+            All points evaluated by the wrapped function and their values.
+
+        """
+        return self.__archive
+
+    def get_value(self, x_value: float, y_value: float) -> float:
+        """
+        Calculate the value of the wrapped function at a point.
+
+        Points that have already been evaluated are taken from the archive and are
+        not counted as true evaluations.
+
+        Parameters
+        ----------
+        x_value
+            X value of the point.
+        y_value: float
+            Y value of the point.
+
+        Returns
+        -------
+        float
+            Value of the wrapped function at the specified point.
+
+        """
+        if (x_value, y_value) not in self.__archive:
+            self.__archive[(x_value, y_value)] = super().get_value(x_value, y_value)
+
+        return self.__archive[(x_value, y_value)]
+
+    def get_values(self, x_values: list[float], y_values: list[float]) -> list[float]:
+        """
+        Calculate the values of the wrapped function at multiple points.
+
+        Only the points missing in the archive are evaluated by the wrapped function.
+
+        Parameters
+        ----------
+        x_values: list[float]
+            X values of the points.
+        y_values: list[float]
+            Y values of the points.
+
+        Returns
+        -------
+        list[float]
+            Values of the wrapped function at the specified points.
+
+        """
+        missing: list[tuple[float, float]] = list(dict.fromkeys(
+            key for key in zip(x_values, y_values) if key not in self.__archive))
+
+        # Evaluate all missing points at once
+        if missing:
+            values: list[float] = super().get_values(
+                [key[0] for key in missing], [key[1] for key in missing])
+            self.__archive.update(zip(missing, values))
+
+        return [self.__archive[key] for key in zip(x_values, y_values)]
+
+    def surrogate_search(
+            self, starting_point: Point, distance: float,
+            radius: float | None = None) -> Point:
+        """
+        Use the surrogate model assisted trust region method to determine a minimum.
+
+        In every iteration a quadratic model is fitted to the archived points closest
+        to the current point and minimized within the trust region. Its minimizer is
+        evaluated by the wrapped function and accepted if it lowers the value. The
+        trust region is enlarged if the model predicted the reduction well and shrunk
+        if it did not, so it is only shrunk after a true evaluation or if the model
+        predicts no reduction at all. Once the trust region has been shrunk, the
+        archived points of the larger trust region are replaced by a fresh stencil.
+        The number of true evaluations can be read from get_evaluation_count.
+
+        Parameters
+        ----------
+        starting_point: Point
+            Point from which the method starts.
+        distance: float
+            The method stops once the trust region is smaller than the distance.
+        radius: float | None
+            Initial radius of the trust region. Defaults to a tenth of the width of
+            the intervals of the function.
+
+        Returns
+        -------
+        current_point: Point
+            Determined point of the minimum.
+
+        """
+        # Initialize the trust region around the starting point
+        current_point: Point = self.clamp_point(starting_point)
+        if radius is None:
+            radius = 0.1 * abs(self.get_intervals()[1].get_x_value() -
+                               self.get_intervals()[0].get_x_value())
+
+        # Move the trust region until the model does not propose a new point anymore
+        while radius >= distance:
+            # Fit the model and determine its minimizer within the trust region
+            self.__ensure_design(current_point, radius)
+            coefficients: list[float] = self.__fit_model(current_point, radius)
+            step: tuple[float, float] = SurrogateFunction.__minimize_model(
+                coefficients)
+            proposed_point: Point = self.clamp_point(Point(
+                current_point.get_x_value() + step[0] * radius,
+                current_point.get_y_value() + step[1] * radius))
+
+            # Compare the predicted with the actual reduction of the value
+            predicted: float = -SurrogateFunction.__evaluate_model(
+                coefficients,
+                (proposed_point.get_x_value() - current_point.get_x_value()) / radius,
+                (proposed_point.get_y_value() - current_point.get_y_value()) / radius)
+            actual: float = (
+                self.get_value(current_point.get_x_value(), current_point.get_y_value())
+                - self.get_value(
+                    proposed_point.get_x_value(), proposed_point.get_y_value()))
+            ratio: float = actual / predicted if predicted > 0 else -1.0
+
+            # Accept the proposed point if it lowers the value
+            if actual > 0:
+                current_point = proposed_point
+
+            # Adapt the trust region to the quality of the model, a proposed point
+            # without predicted reduction is the current one and shrinks it as well
+            if ratio < 0.25:
+                radius *= 0.5
+            elif ratio > 0.75 and (step[0] ** 2 + step[1] ** 2) ** .5 > 0.99:
+                radius *= 2
+
+        return current_point
+
+    def __ensure_design(self, center: Point, radius: float) -> None:
+        """
+        Evaluate additional points if too few archived points are near the center.
+
+        Parameters
+        ----------
+        center: Point
+            Center of the trust region.
+        radius: float
+            Radius of the trust region.
+
+        """
+        # Count the archived points within the stencil around the center, points of
+        # a stencil of a larger trust region do not describe the local shape
+        nearby: int = sum(
+            1 for x_value, y_value in self.__archive
+            if Point.points_are_in_range(center, Point(x_value, y_value), 1.5 * radius))
+
+        # Evaluate a stencil around the center to make the model well-posed
+        if nearby < 6:
+            offsets: list[tuple[float, float]] = [
+                (0, 0), (1, 0), (-1, 0), (0, 1), (0, -1), (1, 1)]
+            stencil: list[Point] = [self.clamp_point(Point(
+                center.get_x_value() + offset[0] * radius,
+                center.get_y_value() + offset[1] * radius)) for offset in offsets]
+            self.get_values([point.get_x_value() for point in stencil],
+                            [point.get_y_value() for point in stencil])
+
+    def __fit_model(self, center: Point, radius: float) -> list[float]:
+        """
+        Fit a quadratic model to the archived points closest to the center.
+
+        Only points within twice the radius of the center are used.
+
+        The model is defined in coordinates scaled by the radius as follows:
+        c0 + c1 * u + c2 * v + c3 * u^2 + c4 * u * v + c5 * v^2
+
+        Parameters
+        ----------
+        center: Point
+            Center of the trust region.
+        radius: float
+            Radius of the trust region.
+
+        Returns
+        -------
+        list[float]
+            The six coefficients of the model.
+
+        """
+        # Select the archived points closest to the center within twice the radius
+        closest: list[tuple[tuple[float, float], float]] = sorted(
+            (item for item in self.__archive.items()
+             if Point.points_are_in_range(center, Point(*item[0]), 2 * radius)),
+            key=lambda item: ((item[0][0] - center.get_x_value()) ** 2 +
+                              (item[0][1] - center.get_y_value()) ** 2)
+        )[:SurrogateFunction.MODEL_POINTS]
+
+        # Build the normal equations of the least squares problem
+        matrix: list[list[float]] = [[0.0] * 6 for _ in range(6)]
+        vector: list[float] = [0.0] * 6
+        for (x_value, y_value), value in closest:
+            u_value: float = (x_value - center.get_x_value()) / radius
+            v_value: float = (y_value - center.get_y_value()) / radius
+            features: list[float] = [1.0, u_value, v_value, u_value ** 2,
+                                     u_value * v_value, v_value ** 2]
+            for row in range(6):
+                vector[row] += features[row] * value
+                for column in range(6):
+                    matrix[row][column] += features[row] * features[column]
+
+        # Regularize the system slightly to keep it solvable
+        for row in range(6):
+            matrix[row][row] += 1e-10
+
+        return SurrogateFunction.__solve(matrix, vector)
+
+    @staticmethod
+    def __solve(matrix: list[list[float]], vector: list[float]) -> list[float]:
+        """
+        Solve a linear system with the Gaussian elimination and partial pivoting.
+
+        Parameters
+        ----------
+        matrix: list[list[float]]
+            Square matrix of the system. It is modified in place.
+        vector: list[float]
+            Right-hand side of the system. It is modified in place.
+
+        Returns
+        -------
+        solution: list[float]
+            Solution of the system.
+
+        """
+        size: int = len(vector)
+
+        # Eliminate all entries below the diagonal
+        for column in range(size):
+            magnitudes: list[float] = [abs(row[column]) for row in matrix]
+            pivot: int = max(range(column, size), key=magnitudes.__getitem__)
+            matrix[column], matrix[pivot] = matrix[pivot], matrix[column]
+            vector[column], vector[pivot] = vector[pivot], vector[column]
+            for row in range(column + 1, size):
+                ratio: float = matrix[row][column] / matrix[column][column]
+                for index in range(column, size):
+                    matrix[row][index] -= ratio * matrix[column][index]
+                vector[row] -= ratio * vector[column]
+
+        # Substitute backwards
+        solution: list[float] = [0.0] * size
+        for row in reversed(range(size)):
+            solution[row] = (vector[row] - sum(
+                matrix[row][index] * solution[index]
+                for index in range(row + 1, size))) / matrix[row][row]
+
+        return solution
+
+    @staticmethod
+    def __evaluate_model(coefficients: list[float], u_value: float,
+                         v_value: float) -> float:
+        """
+        Calculate the change of the model value relative to the center.
+
+        Parameters
+        ----------
+        coefficients: list[float]
+            The six coefficients of the model.
+        u_value: float
+            Scaled X offset from the center.
+        v_value: float
+            Scaled Y offset from the center.
+
+        Returns
+        -------
+        float
+            Change of the model value relative to the center.
+
+        """
+        return (coefficients[1] * u_value + coefficients[2] * v_value +
+                coefficients[3] * u_value ** 2 + coefficients[4] * u_value * v_value +
+                coefficients[5] * v_value ** 2)
+
+    @staticmethod
+    def __minimize_model(coefficients: list[float]) -> tuple[float, float]:
+        """
+        Determine the minimizer of the model within the unit trust region.
+
+        The Newton step is used if the model is convex, otherwise or if it is
+        better the Cauchy point along the negative gradient or the best of
+        BORDER_POINTS points on the border of the trust region is used.
+
+        Parameters
+        ----------
+        coefficients: list[float]
+            The six coefficients of the model.
+
+        Returns
+        -------
+        tuple[float, float]
+            Scaled offset of the minimizer from the center.
+
+        """
+        gradient: tuple[float, float] = (coefficients[1], coefficients[2])
+        hessian: tuple[float, float, float] = (
+            2 * coefficients[3], coefficients[4], 2 * coefficients[5])
+        candidates: list[tuple[float, float]] = [(0.0, 0.0)]
+
+        # Newton step clipped to the trust region if the model is convex
+        determinant: float = hessian[0] * hessian[2] - hessian[1] ** 2
+        if determinant > 0 and hessian[0] > 0:
+            newton: tuple[float, float] = (
+                -(hessian[2] * gradient[0] - hessian[1] * gradient[1]) / determinant,
+                -(hessian[0] * gradient[1] - hessian[1] * gradient[0]) / determinant)
+            length: float = max(1.0, (newton[0] ** 2 + newton[1] ** 2) ** .5)
+            candidates.append((newton[0] / length, newton[1] / length))
+
+        # Cauchy point along the negative gradient
+        norm: float = (gradient[0] ** 2 + gradient[1] ** 2) ** .5
+        if norm > 0:
+            curvature: float = (hessian[0] * gradient[0] ** 2 +
+                                2 * hessian[1] * gradient[0] * gradient[1] +
+                                hessian[2] * gradient[1] ** 2)
+            factor: float = 1 / norm
+            if curvature > 0:
+                factor = min(factor, norm ** 2 / curvature)
+            candidates.append((-gradient[0] * factor, -gradient[1] * factor))
+
+        # Points on the border of the trust region cover directions of small
+        # curvature like curved valleys, in which the Cauchy point stays short
+        candidates.extend(
+            (cos(2 * pi * index / SurrogateFunction.BORDER_POINTS),
+             sin(2 * pi * index / SurrogateFunction.BORDER_POINTS))
+            for index in range(SurrogateFunction.BORDER_POINTS))
+
+        return min(candidates, key=lambda candidate: SurrogateFunction.__evaluate_model(
+            coefficients, candidate[0], candidate[1]))
@@ -0,0 +1,107 @@
+"""Load test comparing the optimization service with the cold-start CLI."""
+
+# Import used Python libraries
+import json
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+# Directory containing the entry point of the project
+SOURCE_DIRECTORY: Path = Path(__file__).resolve().parent
+
+
+def percentile(latencies: list[float], share: float) -> float:
+    """
+    Get a percentile of measured latencies.
+
+    Parameters
+    ----------
+    latencies: list[float]
+        The measured latencies.
+    share: float
+        The share of latencies that are below the percentile, between 0 and 1.
+
+    Returns
+    -------
+    float
+        The percentile of the latencies.
+
+    """
+    ordered: list[float] = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+def request_service(url: str, body: dict) -> float:
+    """
+    Send one request to the service and measure its latency.
+
+    Parameters
+    ----------
+    url: str
+        URL of the optimize endpoint of the service.
+    body: dict
+        The JSON body of the request.
+
+    Returns
+    -------
+    float
+        Latency of the request in seconds.
+
+    """
+    start: float = time.perf_counter()
+    with urlopen(Request(url, json.dumps(body).encode("utf-8"),  # nosec B310
+                         {"Content-Type": "application/json"}), timeout=60) as answer:
+        answer.read()
+    return time.perf_counter() - start
+
+
+def request_cli() -> float:
+    """
+    Run the CLI once and measure its latency.
+
+    Returns
+    -------
+    float
+        Latency of the run in seconds.
+
+    """
+    start: float = time.perf_counter()
+    subprocess.run([sys.executable, str(SOURCE_DIRECTORY)],  # nosec B603
+                   check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """Measure the p50 and p99 latencies of the service and the CLI."""
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000/optimize")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--cli-runs", type=int, default=20)
+    parsed: Namespace = parser.parse_args()
+
+    # Use a distinct starting point for every request, so no result is cached
+    bodies: list[dict] = [
+        {"function": 1, "method": "gradient_descend",
+         "x": 1.0 + 0.5 * i / parsed.requests, "y": 1.0, "distance": 0.01,
+         "factor": 0.1}
+        for i in range(parsed.requests)]
+
+    with ThreadPoolExecutor(parsed.concurrency) as executor:
+        service: list[float] = list(executor.map(
+            lambda body: request_service(parsed.url, body), bodies))
+    cli: list[float] = [request_cli() for _ in range(parsed.cli_runs)]
+
+    for name, latencies in (("service", service), ("cli", cli)):
+        print(f"{name}: p50 {percentile(latencies, 0.5) * 1000:.1f} ms, "
+              f"p99 {percentile(latencies, 0.99) * 1000:.1f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())